@@ -1,6 +1,9 @@
 """Advanced example: Using different LLM providers and comparing results."""
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from interpreter_agent_eval import User, InterpreterAgent, EvaluationFramework
 from interpreter_agent_eval.providers import (
@@ -11,6 +14,43 @@ from interpreter_agent_eval.providers import (
 from interpreter_agent_eval.utils import DataHandler
 
 
+def _run_provider(config, translation_brief, initial_message):
+    """Run the comparison conversation with one provider."""
+    # Create users (manual for consistent testing, using ISO 639-3 codes)
+    user1 = User(name="TechUser", language="eng", is_llm=False)  # English
+    user2 = User(name="DevUser", language="spa", is_llm=False)  # Spanish
+
+    # Create interpreter with this provider
+    interpreter = InterpreterAgent(
+        llm_provider=config["provider"],
+        translation_brief=translation_brief,
+        source_language="eng",
+        target_language="spa",
+        name=f"Interpreter-{config['name']}",
+    )
+
+    # Run evaluation with list of messages
+    framework = EvaluationFramework(
+        user1,
+        user2,
+        interpreter,
+        name=f"comparison_{config['name'].replace(' ', '_')}",
+    )
+
+    messages = [
+        initial_message,
+        "Of course! What specific part would you like me to explain?",
+    ]
+    conversation = framework.run_conversation(messages=messages)
+    metrics = framework.evaluate_translation_quality()
+
+    return {
+        "provider": config["name"],
+        "metrics": metrics,
+        "conversation": conversation,
+    }
+
+
 def compare_providers():
     """Compare different LLM providers for interpretation tasks."""
 
@@ -66,48 +106,16 @@ def compare_providers():
         print("  OPENAI_API_KEY, GOOGLE_API_KEY, or OPENROUTER_API_KEY")
         return
 
-    results = []
-
-    for config in providers_config:
-        print(f"\nTesting {config['name']}...")
-
-        # Create users (manual for consistent testing, using ISO 639-3 codes)
-        user1 = User(name="TechUser", language="eng", is_llm=False)  # English
-        user2 = User(name="DevUser", language="spa", is_llm=False)  # Spanish
-
-        # Create interpreter with this provider
-        interpreter = InterpreterAgent(
-            llm_provider=config["provider"],
-            translation_brief=translation_brief,
-            source_language="eng",
-            target_language="spa",
-            name=f"Interpreter-{config['name']}",
-        )
-
-        # Run evaluation with list of messages
-        framework = EvaluationFramework(
-            user1,
-            user2,
-            interpreter,
-            name=f"comparison_{config['name'].replace(' ', '_')}",
-        )
-
-        messages = [
-            initial_message,
-            "Of course! What specific part would you like me to explain?",
-        ]
-        conversation = framework.run_conversation(messages=messages)
-        metrics = framework.evaluate_translation_quality()
-
-        results.append(
-            {
-                "provider": config["name"],
-                "metrics": metrics,
-                "conversation": conversation,
-            }
-        )
-
-        print(f"  Average translation time: {metrics['average_translation_time']:.3f}s")
+    # Providers are independent, so run them in parallel threads; the GIL is
+    # released while waiting on the network
+    print(f"\nTesting {len(providers_config)} provider(s) in parallel...")
+    run_provider = partial(
+        _run_provider,
+        translation_brief=translation_brief,
+        initial_message=initial_message,
+    )
+    with ThreadPoolExecutor(max_workers=len(providers_config)) as executor:
+        results = list(executor.map(run_provider, providers_config))
 
     # Save comparison results
     output_dir = os.path.join(os.path.dirname(__file__), "output")
@@ -138,13 +146,18 @@ def multi_language_scenario():
 
     # Mock provider for demonstration
     class MockProvider:
+        # Target language is read from the prompt's "Translation (<code>):" line
+        _TARGET = re.compile(r"Translations? \((\w+)\):")
+        _RESPONSES = {
+            "fra": "Bonjour! Comment puis-je vous aider?",
+            "deu": "Guten Tag! Wie kann ich Ihnen helfen?",
+            "jpn": "こんにちは！どのようにお手伝いできますか？",
+        }
+
         def generate(self, prompt, **kwargs):
-            if "fra" in prompt or "French" in prompt:
-                return "Bonjour! Comment puis-je vous aider?"
-            elif "deu" in prompt or "German" in prompt:
-                return "Guten Tag! Wie kann ich Ihnen helfen?"
-            elif "jpn" in prompt or "Japanese" in prompt:
-                return "こんにちは！どのようにお手伝いできますか？"
+            match = self._TARGET.search(prompt)
+            if match:
+                return self._RESPONSES.get(match.group(1), "Translation")
             return "Translation"
 
         def get_provider_name(self):
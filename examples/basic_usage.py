@@ -1,6 +1,7 @@
 """Example usage of the interpreter agent evaluation framework."""
 
 import os
+import re
 
 from interpreter_agent_eval import User, InterpreterAgent, EvaluationFramework
 
@@ -16,12 +17,18 @@ def example_with_manual_users():
 
     # Create a simple mock provider for demonstration
     class MockProvider:
+        # Target language is read from the prompt's "Translation (<code>):" line
+        _TARGET = re.compile(r"Translations? \((\w+)\):")
+        _RESPONSES = {
+            "spa": "Hola, ¿cómo estás?",
+            "eng": "Hello, how are you?",
+        }
+
         def generate(self, prompt, **kwargs):
             # Simple mock translation
-            if "spa" in prompt or "Spanish" in prompt:
-                return "Hola, ¿cómo estás?"
-            elif "eng" in prompt or "English" in prompt:
-                return "Hello, how are you?"
+            match = self._TARGET.search(prompt)
+            if match:
+                return self._RESPONSES.get(match.group(1), "Translation result")
             return "Translation result"
 
         def get_provider_name(self):
@@ -93,9 +93,8 @@ def demonstrate_aggregation():
     output_dir = os.path.join(os.path.dirname(__file__), "output")
     os.makedirs(output_dir, exist_ok=True)
 
-    result_files = []
-
     # Create multiple evaluation runs
+    frameworks = []
     for i in range(3):
         user1 = User(f"User{i}_1", "eng", is_llm=False)  # English
         user2 = User(f"User{i}_2", "spa", is_llm=False)  # Spanish
@@ -105,11 +104,22 @@ def demonstrate_aggregation():
             source_language="eng",
             target_language="spa",
         )
+        frameworks.append(
+            EvaluationFramework(user1, user2, interpreter, name=f"eval_{i}")
+        )
 
-        framework = EvaluationFramework(user1, user2, interpreter, name=f"eval_{i}")
-        num_messages = 2 + i
-        messages = [f"Test message {j+1}" for j in range(num_messages)]
-        framework.run_conversation(messages=messages)
+    # The runs are independent, so their LLM calls can overlap;
+    # max_concurrency caps in-flight requests to stay within provider rate limits.
+    EvaluationFramework.run_conversations_batch(
+        [
+            (framework, [f"Test message {j+1}" for j in range(2 + i)])
+            for i, framework in enumerate(frameworks)
+        ],
+        max_concurrency=3,
+    )
+
+    result_files = []
+    for i, framework in enumerate(frameworks):
         metrics = framework.evaluate_translation_quality()
 
         filepath = os.path.join(output_dir, f"eval_{i}.json")
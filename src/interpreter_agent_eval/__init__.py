@@ -3,9 +3,34 @@
 A framework for evaluating interpreter/translator agents between users speaking different languages.
 """
 
-from .user import User
-from .interpreter import InterpreterAgent
-from .evaluator import EvaluationFramework
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .user import User
+    from .interpreter import InterpreterAgent
+    from .evaluator import EvaluationFramework
 
 __version__ = "0.1.0"
 __all__ = ["User", "InterpreterAgent", "EvaluationFramework"]
+
+# Public names and the submodules defining them, imported on first access
+# (PEP 562) so `import interpreter_agent_eval` stays cheap
+_LAZY_IMPORTS = {
+    "User": ".user",
+    "InterpreterAgent": ".interpreter",
+    "EvaluationFramework": ".evaluator",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,13 +1,81 @@
 """Evaluation framework for interpreter agents."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Coroutine, Iterator, Sequence, Tuple
+from array import array
+import asyncio
+import contextlib
+import csv
+import dataclasses
 import json
+import statistics
 import time
-from datetime import datetime
-from pathlib import Path
+from datetime import datetime, timezone
 
 from .user import User
 from .interpreter import InterpreterAgent
+from .models import Turn
+from .providers._client_cache import aclose_async_clients
+from .utils.cache import LRUCache
+from .utils.data_handler import DataHandler, _open_output
+from .utils.stats import RunningStats
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+
+# Fields of a logged conversation turn, in export order
+_TURN_FIELDS = tuple(field.name for field in dataclasses.fields(Turn))
+# Same fields as exported, with the timestamp formatted as an ISO string
+_EXPORT_FIELDS = tuple(
+    "timestamp" if field == "timestamp_ns" else field for field in _TURN_FIELDS
+)
+
+
+def _json_line(value: Any) -> str:
+    """Serialize a value as a single line of JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, ensure_ascii=False)
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _conversation_clock() -> Callable[[], int]:
+    """Create a clock for the turn timestamps of one conversation.
+    
+    The wall clock is read once; each reading afterwards is derived from the
+    monotonic ``perf_counter_ns``, so timestamps within a conversation never go
+    backwards and share the clock used for translation times.
+    
+    Returns:
+        Function returning the current time in nanoseconds since the epoch
+    """
+    epoch_ns = time.time_ns()
+    origin_ns = time.perf_counter_ns()
+    return lambda: epoch_ns + (time.perf_counter_ns() - origin_ns)
+
+
+def _run_blocking(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine that never suspends to completion, without an event loop.
+    
+    The blocking entry points run the turn loop with synchronous LLM calls only,
+    so they reuse the providers' shared sync clients and also work where an
+    event loop is already running (e.g. in Jupyter).
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coroutine.close()
+    raise RuntimeError("Blocking conversation unexpectedly waited on the event loop")
+
+
+def _format_timestamp(timestamp_ns: int) -> str:
+    """Format a ``time.time_ns()`` value as an ISO 8601 UTC timestamp."""
+    return datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc).isoformat()
 
 
 class EvaluationFramework:
@@ -22,7 +90,10 @@ class EvaluationFramework:
         user1: User,
         user2: User,
         interpreter: InterpreterAgent,
-        name: Optional[str] = None
+        name: Optional[str] = None,
+        cache: Optional[LRUCache] = None,
+        log_path: Optional[str] = None,
+        record_detail: str = "full"
     ):
         """Initialize the evaluation framework.
         
@@ -31,75 +102,487 @@ class EvaluationFramework:
             user2: Second user
             interpreter: Interpreter agent
             name: Optional name for this evaluation session
+            cache: Optional translation cache for the interpreter. Pass the same
+                instance to several frameworks to share hits between them.
+            log_path: Optional JSONL file that turns are appended to as they
+                complete, instead of being kept in memory. The file is
+                overwritten by the first run and by the first run after
+                :meth:`reset`.
+            record_detail: 'full' to keep every turn, or 'metrics_only' to keep
+                just the translation times, for long runs where only
+                :meth:`evaluate_translation_quality` is needed. Metrics-only
+                frameworks have no turns to return or export: :meth:`to_columns`
+                holds only ``translation_time``, and JSON exports leave out
+                ``conversation`` and are marked with ``record_detail``. Ignored
+                when ``log_path`` is set.
         """
+        if record_detail not in ("full", "metrics_only"):
+            raise ValueError(f"Unsupported record detail: {record_detail}")
+        
         self.user1 = user1
         self.user2 = user2
         self.interpreter = interpreter
-        self.name = name or f"eval_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        self.conversation_log = []
+        if cache is not None:
+            self.interpreter.cache = cache
+        self.name = name or self._default_name()
+        # Turns are stored column-wise (one list per field); see conversation_log
+        self._columns = {field: [] for field in _TURN_FIELDS}
+        self._columns["translation_time"] = array("d")
+        self._time_stats = RunningStats()
         self.metrics = {}
+        self.log_path = log_path
+        self._log_started = False
+        self.record_detail = "full" if log_path else record_detail
+        
+        # Per-turn interpreter contexts, grown as longer conversations are run
+        self._contexts: List[str] = []
     
     def run_conversation(
         self,
         messages: List[str],
-        from_user: int = 1
+        from_user: int = 1,
+        batch: bool = False
     ) -> List[Dict[str, Any]]:
         """Run a conversation between the two users via the interpreter.
         
         Args:
             messages: List of messages to exchange. Each message is sent by alternating users.
             from_user: Which user starts (1 or 2)
-            
+            batch: Translate all messages of each user in one LLM request. Only
+                applies when neither user is LLM-powered, since the messages are
+                then known upfront.
+                
         Returns:
-            List of conversation exchanges
+            The turns of this run, one dictionary each. Empty when turns go to
+            ``log_path`` or only metrics are recorded; read them back through
+            :attr:`conversation_log` or :meth:`iter_turns` instead.
             
         Note:
             Users only communicate through the interpreter agent. Each user's conversation
             history contains only their own messages and the interpreter's translated responses.
             For LLM-powered users, they generate responses based on the translated messages
             they receive from the interpreter.
+            
+            LLM calls are made with the providers' blocking ``generate``; use
+            :meth:`run_conversation_async` to overlap several conversations.
         """
-        current_user = self.user1 if from_user == 1 else self.user2
-        other_user = self.user2 if from_user == 1 else self.user1
+        return _run_blocking(
+            self._run_conversation(messages, from_user, None, batch, blocking=True)
+        )
+    
+    async def run_conversation_async(
+        self,
+        messages: List[str],
+        from_user: int = 1,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        batch: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Run a conversation between the two users via the interpreter asynchronously.
         
-        for turn, message in enumerate(messages):
-            # Record the turn
-            turn_data = {
-                "turn": turn + 1,
-                "timestamp": datetime.now().isoformat(),
-                "from_user": current_user.name,
-                "to_user": other_user.name
-            }
+        Turns stay sequential because each one depends on the previous, but several
+        frameworks can run concurrently, e.g. with ``asyncio.gather``, so their LLM
+        calls overlap instead of adding up.
+        
+        Args:
+            messages: List of messages to exchange. Each message is sent by alternating users.
+            from_user: Which user starts (1 or 2)
+            semaphore: Optional semaphore gating every LLM call of this conversation.
+                Share one across concurrent frameworks to respect provider rate limits.
+            batch: Translate all messages of each user in one LLM request (see
+                :meth:`run_conversation`)
+                
+        Returns:
+            The turns of this run, as returned by :meth:`run_conversation`
+        """
+        return await self._run_conversation(messages, from_user, semaphore, batch)
+    
+    async def _run_conversation(
+        self,
+        messages: List[str],
+        from_user: int,
+        semaphore: Optional[asyncio.Semaphore],
+        batch: bool,
+        blocking: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Run a conversation, recording its turns according to the framework's settings.
+        
+        With ``blocking``, LLM calls use the synchronous provider methods and the
+        coroutine never suspends (see :func:`_run_blocking`).
+        """
+        limiter = semaphore or contextlib.nullcontext()
+        first_turn = len(self._columns["turn"])
+        if self.log_path:
+            mode = 'a' if self._log_started else 'w'
+            self._log_started = True
+            with _open_output(self.log_path, mode, encoding='utf-8') as f:
+                def spill_turn(record: Turn) -> None:
+                    self._time_stats.add(record.translation_time)
+                    f.write(_json_line(record.to_dict()) + "\n")
+                
+                await self._converse(messages, from_user, limiter, batch, spill_turn, blocking)
+        elif self.record_detail == "metrics_only":
+            await self._converse(messages, from_user, limiter, batch, self._log_timing, blocking)
+        else:
+            await self._converse(messages, from_user, limiter, batch, self._log_turn, blocking)
+        # Only the turns of this run, so repeated runs don't copy the whole log
+        # again; turns written to log_path aren't read back
+        columns = [self._columns[field][first_turn:] for field in _TURN_FIELDS]
+        return [self._export_turn(Turn(*row)) for row in zip(*columns)]
+    
+    @classmethod
+    def run_conversations_batch(
+        cls,
+        sessions: Sequence[Tuple["EvaluationFramework", List[str]]],
+        max_concurrency: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Run several independent conversations concurrently.
+        
+        This is a blocking wrapper around :meth:`run_conversations_batch_async`;
+        the async clients it opens are closed before it returns. Called where an
+        event loop is already running (e.g. in Jupyter), it runs the sessions one
+        after another with blocking calls instead.
+        
+        Args:
+            sessions: (framework, messages) pairs, one per conversation
+            max_concurrency: Maximum number of LLM calls in flight across all
+                sessions. Unbounded if not given.
+                
+        Returns:
+            The turns of each session's run, in the order of ``sessions``
+        """
+        async def run_batch() -> List[List[Dict[str, Any]]]:
+            try:
+                return await cls.run_conversations_batch_async(sessions, max_concurrency)
+            finally:
+                await aclose_async_clients()
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(run_batch())
+        return [framework.run_conversation(messages) for framework, messages in sessions]
+    
+    @staticmethod
+    async def run_conversations_batch_async(
+        sessions: Sequence[Tuple["EvaluationFramework", List[str]]],
+        max_concurrency: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Run several independent conversations concurrently.
+        
+        Each session's turns stay sequential; the sessions overlap their LLM calls
+        through ``asyncio.gather``.
+        
+        Args:
+            sessions: (framework, messages) pairs, one per conversation
+            max_concurrency: Maximum number of LLM calls in flight across all
+                sessions. Unbounded if not given.
+                
+        Returns:
+            The turns of each session's run, in the order of ``sessions``
+        """
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        return await asyncio.gather(*(
+            framework.run_conversation_async(messages, semaphore=semaphore)
+            for framework, messages in sessions
+        ))
+    
+    def run_conversation_streaming(
+        self,
+        messages: List[str],
+        output_path: str,
+        format: str = "jsonl",
+        from_user: int = 1
+    ) -> None:
+        """Run a conversation, writing each turn to a file as soon as it completes.
+        
+        Turns are not kept in memory, so memory use doesn't grow with the length
+        of the conversation. :meth:`evaluate_translation_quality` still works
+        afterwards, but :attr:`conversation_log` won't contain the streamed turns.
+        
+        Args:
+            messages: List of messages to exchange. Each message is sent by alternating users.
+            output_path: Path of the file to write
+            format: Output format ('jsonl' or 'csv')
+            from_user: Which user starts (1 or 2)
+        """
+        _run_blocking(
+            self._run_conversation_streaming(
+                messages, output_path, format, from_user, None, blocking=True
+            )
+        )
+    
+    async def run_conversation_streaming_async(
+        self,
+        messages: List[str],
+        output_path: str,
+        format: str = "jsonl",
+        from_user: int = 1,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> None:
+        """Asynchronous version of :meth:`run_conversation_streaming`.
+        
+        Args:
+            messages: List of messages to exchange. Each message is sent by alternating users.
+            output_path: Path of the file to write
+            format: Output format ('jsonl' or 'csv')
+            from_user: Which user starts (1 or 2)
+            semaphore: Optional semaphore gating every LLM call of this conversation
+        """
+        await self._run_conversation_streaming(messages, output_path, format, from_user, semaphore)
+    
+    async def _run_conversation_streaming(
+        self,
+        messages: List[str],
+        output_path: str,
+        format: str,
+        from_user: int,
+        semaphore: Optional[asyncio.Semaphore],
+        blocking: bool = False
+    ) -> None:
+        """Run a streamed conversation, blocking or not as in :meth:`_run_conversation`."""
+        if format not in ("jsonl", "csv"):
+            raise ValueError(f"Unsupported streaming format: {format}")
+        
+        limiter = semaphore or contextlib.nullcontext()
+        with _open_output(output_path, 'w', newline='', encoding='utf-8') as f:
+            if format == "jsonl":
+                def write_turn(record: Turn) -> None:
+                    self._time_stats.add(record.translation_time)
+                    f.write(_json_line(self._export_turn(record)) + "\n")
+            else:
+                writer = csv.writer(f)
+                writer.writerow(_EXPORT_FIELDS)
+                
+                def write_turn(record: Turn) -> None:
+                    self._time_stats.add(record.translation_time)
+                    writer.writerow(self._export_turn(record).values())
+            
+            await self._converse(messages, from_user, limiter, False, write_turn, blocking)
+    
+    async def _converse(
+        self,
+        messages: List[str],
+        from_user: int,
+        limiter: Any,
+        batch: bool,
+        log_turn: Callable[[Turn], None],
+        blocking: bool = False
+    ) -> None:
+        """Run the turn loop, handing each completed :class:`Turn` to ``log_turn``.
+        
+        With ``blocking``, the users and the interpreter are called through their
+        synchronous methods.
+        """
+        if batch and not (self.user1.is_llm or self.user2.is_llm):
+            await self._converse_batch(messages, from_user, limiter, log_turn, blocking)
+            return
+        
+        clock = _conversation_clock()
+        pairs = self._sender_receiver_pairs(len(messages), from_user)
+        contexts = self._turn_contexts(len(messages))
+        for turn, (message, (current_user, other_user)) in enumerate(zip(messages, pairs)):
+            timestamp_ns = clock()
             
             # Current user sends message in their language
-            sent_message = current_user.send_message(message)
-            turn_data["original_message"] = sent_message
-            turn_data["original_language"] = current_user.language
+            async with limiter:
+                if blocking:
+                    sent_message = current_user.send_message(message)
+                else:
+                    sent_message = await current_user.send_message_async(message)
             
             # Interpreter translates
-            start_time = time.time()
-            translation_result = self.interpreter.facilitate_conversation(
-                sent_message,
-                current_user.language,
-                other_user.language,
-                context=f"Turn {turn + 1} of conversation"
-            )
-            translation_time = time.time() - start_time
-            
-            turn_data["translated_message"] = translation_result["translation"]
-            turn_data["translated_language"] = translation_result["translation_language"]
-            turn_data["translation_time"] = translation_time
+            async with limiter:
+                start_ns = time.perf_counter_ns()
+                facilitate = (
+                    self.interpreter.facilitate_conversation if blocking
+                    else self.interpreter.facilitate_conversation_async
+                )
+                translation_result = facilitate(
+                    sent_message,
+                    current_user.language,
+                    other_user.language,
+                    context=contexts[turn]
+                )
+                if not blocking:
+                    translation_result = await translation_result
+                translation_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             # Other user receives the translation from interpreter (not directly from the user)
             other_user.receive_message(translation_result["translation"], metadata={"from": "interpreter"})
             
             # Log the turn
-            self.conversation_log.append(turn_data)
+            log_turn(Turn(
+                turn + 1,
+                timestamp_ns,
+                current_user.name,
+                other_user.name,
+                sent_message,
+                current_user.language,
+                translation_result["translation"],
+                translation_result["translation_language"],
+                translation_time
+            ))
+    
+    def _sender_receiver_pairs(self, num_turns: int, from_user: int) -> List[Tuple[User, User]]:
+        """Precompute the (sender, receiver) pair of every turn.
+        
+        Args:
+            num_turns: Number of turns in the conversation
+            from_user: Which user starts (1 or 2)
             
-            # Swap users for next turn
-            current_user, other_user = other_user, current_user
+        Returns:
+            List of (sender, receiver) user tuples, alternating between the users
+        """
+        forward = (self.user1, self.user2) if from_user == 1 else (self.user2, self.user1)
+        backward = (forward[1], forward[0])
+        return [forward if turn % 2 == 0 else backward for turn in range(num_turns)]
+    
+    def _turn_contexts(self, num_turns: int) -> List[str]:
+        """Get the interpreter context string of every turn.
         
-        return self.conversation_log
+        Contexts are formatted once per turn number and reused by later runs.
+        
+        Args:
+            num_turns: Number of turns in the conversation
+            
+        Returns:
+            List indexed by 0-based turn, with at least ``num_turns`` entries
+        """
+        contexts = self._contexts
+        if len(contexts) < num_turns:
+            template = "Turn {} of conversation".format
+            contexts.extend(template(turn + 1) for turn in range(len(contexts), num_turns))
+        return contexts
+    
+    async def _converse_batch(
+        self,
+        messages: List[str],
+        from_user: int,
+        limiter: Any,
+        log_turn: Callable[[Turn], None],
+        blocking: bool = False
+    ) -> None:
+        """Run a conversation between human users, batching translations per sender.
+        
+        Each user's messages go to the interpreter in a single request, and the
+        batch time is split evenly across the turns it covers.
+        """
+        clock = _conversation_clock()
+        pairs = self._sender_receiver_pairs(len(messages), from_user)
+        contexts = self._turn_contexts(len(messages))
+        
+        translations = [None] * len(messages)
+        translation_times = [0.0] * len(messages)
+        for offset in (0, 1):
+            turns = range(offset, len(messages), 2)
+            if not turns:
+                continue
+            sender, receiver = pairs[offset]
+            async with limiter:
+                start_ns = time.perf_counter_ns()
+                facilitate = (
+                    self.interpreter.facilitate_batch if blocking
+                    else self.interpreter.facilitate_batch_async
+                )
+                results = facilitate(
+                    [messages[turn] for turn in turns],
+                    sender.language,
+                    receiver.language,
+                    contexts=[contexts[turn] for turn in turns]
+                )
+                if not blocking:
+                    results = await results
+                batch_time = (time.perf_counter_ns() - start_ns) / 1e9
+            for turn, result in zip(turns, results):
+                translations[turn] = result
+                translation_times[turn] = batch_time / len(turns)
+        
+        for turn, (message, (current_user, other_user)) in enumerate(zip(messages, pairs)):
+            sent_message = current_user.send_message(message)
+            translation_result = translations[turn]
+            other_user.receive_message(translation_result["translation"], metadata={"from": "interpreter"})
+            
+            log_turn(Turn(
+                turn + 1,
+                clock(),
+                current_user.name,
+                other_user.name,
+                sent_message,
+                current_user.language,
+                translation_result["translation"],
+                translation_result["translation_language"],
+                translation_times[turn]
+            ))
+    
+    def _log_turn(self, record: Turn) -> None:
+        """Append one turn to the column store."""
+        self._time_stats.add(record.translation_time)
+        columns = self._columns
+        columns["turn"].append(record.turn)
+        columns["timestamp_ns"].append(record.timestamp_ns)
+        columns["from_user"].append(record.from_user)
+        columns["to_user"].append(record.to_user)
+        columns["original_message"].append(record.original_message)
+        columns["original_language"].append(record.original_language)
+        columns["translated_message"].append(record.translated_message)
+        columns["translated_language"].append(record.translated_language)
+        columns["translation_time"].append(record.translation_time)
+    
+    def _log_timing(self, record: Turn) -> None:
+        """Keep only the translation time of a turn, for metrics-only runs."""
+        self._time_stats.add(record.translation_time)
+        self._columns["translation_time"].append(record.translation_time)
+    
+    def iter_turns(self) -> Iterator[Turn]:
+        """Iterate over the logged conversation turns.
+        
+        Yields:
+            One :class:`Turn` per logged turn, in order
+        """
+        columns = [self._columns[field] for field in _TURN_FIELDS]
+        for row in zip(*columns):
+            yield Turn(*row)
+        for row in self._read_log():
+            yield Turn(**row)
+    
+    def _read_log(self) -> Iterator[Dict[str, Any]]:
+        """Read back the turns appended to ``log_path``, if any."""
+        if not self._log_started:
+            return
+        with open(self.log_path, encoding='utf-8') as f:
+            for line in f:
+                yield _json_loads(line)
+    
+    @property
+    def conversation_log(self) -> List[Dict[str, Any]]:
+        """Conversation turns as a list of dictionaries, one per turn.
+        
+        The dictionaries have the same fields as exported turns, with an ISO
+        ``timestamp``. Turns are stored column-wise (or in the ``log_path``
+        file), so this view is built on access; modifying the returned list
+        doesn't change the framework's log.
+        """
+        return [self._export_turn(record) for record in self.iter_turns()]
+    
+    def to_columns(self) -> Dict[str, Sequence[Any]]:
+        """Get the logged turns column-wise, one sequence per turn field.
+        
+        Suited to bulk aggregation over long runs: ``translation_time`` is an
+        ``array('d')``, which supports the buffer protocol (e.g.
+        ``numpy.frombuffer``). The sequences are copies, so modifying them
+        doesn't change the framework's log.
+        
+        Returns:
+            Dictionary mapping each field of :class:`Turn` to its values, in turn
+            order; only ``translation_time`` with ``record_detail='metrics_only'``
+        """
+        if self.record_detail == "metrics_only":
+            return {"translation_time": self._columns["translation_time"][:]}
+        columns = {field: column[:] for field, column in self._columns.items()}
+        for row in self._read_log():
+            for field, column in columns.items():
+                column.append(row[field])
+        return columns
     
     def evaluate_translation_quality(self) -> Dict[str, Any]:
         """Evaluate the quality of translations.
@@ -110,23 +593,53 @@ class EvaluationFramework:
         Returns:
             Dictionary of evaluation metrics
         """
-        if not self.conversation_log:
+        if not self._time_stats.count:
             return {"error": "No conversation data to evaluate"}
         
         metrics = {
-            "total_turns": len(self.conversation_log),
-            "average_translation_time": sum(
-                turn.get("translation_time", 0) for turn in self.conversation_log
-            ) / len(self.conversation_log),
+            "total_turns": self._time_stats.count,
+            "average_translation_time": self._time_stats.mean,
+            "translation_time_stdev": self._time_stats.stdev,
             "languages": {
                 self.user1.language: self.user1.name,
                 self.user2.language: self.user2.name
             }
         }
         
+        # The distribution needs the individual times, which streamed runs don't
+        # keep; it is only reported when it covers every turn
+        translation_times = self._columns["translation_time"]
+        if self._log_started:
+            translation_times = array("d", (row["translation_time"] for row in self._read_log()))
+        if len(translation_times) == self._time_stats.count:
+            metrics.update(self._translation_time_distribution(translation_times))
+        
         self.metrics = metrics
         return metrics
     
+    @staticmethod
+    def _translation_time_distribution(translation_times: Sequence[float]) -> Dict[str, float]:
+        """Summarize the distribution of translation times.
+        
+        Args:
+            translation_times: Non-empty sequence of translation times in seconds
+            
+        Returns:
+            Minimum, maximum, median and 95th percentile translation times
+        """
+        if len(translation_times) > 1:
+            percentiles = statistics.quantiles(translation_times, n=100, method="inclusive")
+            p50, p95 = percentiles[49], percentiles[94]
+        else:
+            p50 = p95 = translation_times[0]
+        
+        return {
+            "min_translation_time": min(translation_times),
+            "max_translation_time": max(translation_times),
+            "p50_translation_time": p50,
+            "p95_translation_time": p95
+        }
+    
     def export_results(self, filepath: str, format: str = "json") -> None:
         """Export evaluation results to a file.
         
@@ -134,9 +647,59 @@ class EvaluationFramework:
             filepath: Path to save the results
             format: Export format ('json' or 'txt')
         """
+        if format == "json":
+            self._export_json(filepath)
+        elif format == "txt":
+            self._export_txt(filepath)
+    
+    def _export_json(self, filepath: str) -> None:
+        """Export the full results, including every turn, as JSON."""
+        if self._log_started:
+            self._export_json_from_log(filepath)
+            return
+        
         results = {
             "session_name": self.name,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _format_timestamp(time.time_ns()),
+            **self._participants()
+        }
+        if self.record_detail == "metrics_only":
+            results["record_detail"] = self.record_detail
+        else:
+            results["conversation"] = [self._export_turn(record) for record in self.iter_turns()]
+        results["metrics"] = self.metrics
+        DataHandler.save_conversation_data(results, filepath, indent=2)
+    
+    def _export_json_from_log(self, filepath: str) -> None:
+        """Export the results as JSON, copying the turns from ``log_path`` one at a time.
+        
+        Produces the same document as :meth:`_export_json` without holding the
+        conversation in memory; each turn is written on a single line.
+        """
+        def encode(value: Any) -> str:
+            return json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+        
+        header = {
+            "session_name": self.name,
+            "timestamp": _format_timestamp(time.time_ns()),
+            **self._participants()
+        }
+        
+        with _open_output(filepath, 'w', encoding='utf-8') as f:
+            f.write("{\n")
+            for key, value in header.items():
+                f.write(f"  {json.dumps(key)}: {encode(value)},\n")
+            f.write('  "conversation": [')
+            count = 0
+            for count, row in enumerate(self._read_log(), start=1):
+                turn = self._export_turn(Turn(**row))
+                f.write(("\n    " if count == 1 else ",\n    ") + _json_line(turn))
+            f.write("\n  ],\n" if count else "],\n")
+            f.write(f'  "metrics": {encode(self.metrics)}\n}}')
+    
+    def _participants(self) -> Dict[str, Any]:
+        """Describe the users and the interpreter, as they are at export time."""
+        return {
             "users": {
                 "user1": {
                     "name": self.user1.name,
@@ -152,37 +715,57 @@ class EvaluationFramework:
             "interpreter": {
                 "name": self.interpreter.name,
                 "translation_brief": self.interpreter.translation_brief
-            },
-            "conversation": self.conversation_log,
-            "metrics": self.metrics
+            }
         }
+    
+    def _export_txt(self, filepath: str) -> None:
+        """Export a human-readable report."""
+        # Build the report in memory and write it in one go
+        parts = [
+            f"Evaluation Session: {self.name}\n",
+            f"Timestamp: {_format_timestamp(time.time_ns())}\n\n",
+            "Users:\n",
+            f"  User 1: {self.user1.name} ({self.user1.language})\n",
+            f"  User 2: {self.user2.name} ({self.user2.language})\n\n",
+            f"Interpreter: {self.interpreter.name}\n\n",
+            "Conversation:\n",
+            "=" * 80 + "\n"
+        ]
+        if self.record_detail == "metrics_only":
+            parts.append("\nNot recorded (record_detail='metrics_only')\n")
+        parts.extend(
+            f"\nTurn {record.turn}:\n"
+            f"  From: {record.from_user} ({record.original_language})\n"
+            f"  Message: {record.original_message}\n"
+            f"  Translation: {record.translated_message}\n"
+            f"  Time: {record.translation_time:.3f}s\n"
+            for record in self.iter_turns()
+        )
+        parts.append("\n" + "=" * 80 + "\n")
+        parts.append("\nMetrics:\n")
+        parts.extend(f"  {key}: {value}\n" for key, value in self.metrics.items())
         
-        # Ensure parent directory exists
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        with _open_output(filepath, 'w', encoding='utf-8') as f:
+            f.write("".join(parts))
+    
+    @staticmethod
+    def _export_turn(record: Turn) -> Dict[str, Any]:
+        """Convert a turn for export, with fields in ``_EXPORT_FIELDS`` order.
         
-        if format == "json":
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
-        elif format == "txt":
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"Evaluation Session: {self.name}\n")
-                f.write(f"Timestamp: {results['timestamp']}\n\n")
-                f.write(f"Users:\n")
-                f.write(f"  User 1: {self.user1.name} ({self.user1.language})\n")
-                f.write(f"  User 2: {self.user2.name} ({self.user2.language})\n\n")
-                f.write(f"Interpreter: {self.interpreter.name}\n\n")
-                f.write("Conversation:\n")
-                f.write("=" * 80 + "\n")
-                for turn in self.conversation_log:
-                    f.write(f"\nTurn {turn['turn']}:\n")
-                    f.write(f"  From: {turn['from_user']} ({turn['original_language']})\n")
-                    f.write(f"  Message: {turn['original_message']}\n")
-                    f.write(f"  Translation: {turn['translated_message']}\n")
-                    f.write(f"  Time: {turn['translation_time']:.3f}s\n")
-                f.write("\n" + "=" * 80 + "\n")
-                f.write("\nMetrics:\n")
-                for key, value in self.metrics.items():
-                    f.write(f"  {key}: {value}\n")
+        Timestamps are kept as integers while the conversation runs and only
+        turned into ISO strings here.
+        """
+        return {
+            "turn": record.turn,
+            "timestamp": _format_timestamp(record.timestamp_ns),
+            "from_user": record.from_user,
+            "to_user": record.to_user,
+            "original_message": record.original_message,
+            "original_language": record.original_language,
+            "translated_message": record.translated_message,
+            "translated_language": record.translated_language,
+            "translation_time": record.translation_time
+        }
     
     def get_conversation_summary(self) -> Dict[str, Any]:
         """Get a summary of the conversation.
@@ -192,9 +775,35 @@ class EvaluationFramework:
         """
         return {
             "session_name": self.name,
-            "total_turns": len(self.conversation_log),
+            "total_turns": self._time_stats.count,
             "user1": f"{self.user1.name} ({self.user1.language})",
             "user2": f"{self.user2.name} ({self.user2.language})",
             "interpreter": self.interpreter.name,
             "metrics": self.metrics
         }
+    
+    def reset(self, name: Optional[str] = None) -> "EvaluationFramework":
+        """Clear the logged turns and metrics so the framework can run a new session.
+        
+        The column lists are emptied in place rather than reallocated, and the
+        ``log_path`` file, if any, is overwritten by the next run. Users and the
+        interpreter are kept as they are, including their histories.
+        
+        Args:
+            name: Optional name for the new session
+            
+        Returns:
+            This framework, for chaining
+        """
+        for column in self._columns.values():
+            del column[:]
+        self._time_stats.reset()
+        self.metrics = {}
+        self._log_started = False
+        self.name = name or self._default_name()
+        return self
+    
+    @staticmethod
+    def _default_name() -> str:
+        """Name a session after the current time."""
+        return f"eval_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -1,6 +1,16 @@
 """Interpreter agent for translating between users."""
 
-from typing import Optional, Dict, Any
+import hashlib
+import re
+import sys
+from collections import deque
+from typing import Optional, Dict, Any, Deque, List, Tuple
+
+from .providers.base import agenerate_from
+from .utils.cache import LRUCache
+
+# A "<number>. <text>" or "<number>) <text>" line of a batch translation response
+_NUMBERED_LINE = re.compile(r"^\s*(\d+)[.)]\s*(.*?)\s*$")
 
 
 class InterpreterAgent:
@@ -16,7 +26,10 @@ class InterpreterAgent:
         translation_brief: str,
         source_language: str,
         target_language: str,
-        name: str = "Interpreter"
+        name: str = "Interpreter",
+        use_cache: bool = True,
+        cache: Optional[LRUCache] = None,
+        history_maxlen: Optional[int] = None
     ):
         """Initialize the InterpreterAgent.
         
@@ -26,13 +39,22 @@ class InterpreterAgent:
             source_language: Source language code
             target_language: Target language code
             name: Name for the interpreter agent
+            use_cache: Whether to reuse translations of identical requests
+            cache: Optional cache instance, e.g. shared between interpreters
+            history_maxlen: Maximum number of translations kept in
+                ``translation_history``; older ones are dropped first. Keeps
+                memory bounded in long evaluations. Unbounded if not provided.
         """
         self.llm_provider = llm_provider
         self.translation_brief = translation_brief
-        self.source_language = source_language
-        self.target_language = target_language
+        self.source_language = sys.intern(source_language)
+        self.target_language = sys.intern(target_language)
         self.name = name
-        self.translation_history = []
+        self.translation_history: Deque[Dict[str, Any]] = deque(maxlen=history_maxlen)
+        self.use_cache = use_cache
+        self.cache = cache if cache is not None else LRUCache()
+        # Static prompt parts per (brief, from, to), see _prompt_frame
+        self._prompt_frames: Dict[Tuple[str, str, str], Tuple[str, str]] = {}
     
     def translate(
         self,
@@ -55,19 +77,116 @@ class InterpreterAgent:
         from_lang = from_language or self.source_language
         to_lang = to_language or self.target_language
         
-        prompt = self._build_translation_prompt(message, from_lang, to_lang, context)
-        translation = self.llm_provider.generate(prompt)
+        key = self._cache_key(message, from_lang, to_lang, context)
+        translation = self._cache_lookup(key)
+        if translation is None:
+            prompt = self._build_translation_prompt(message, from_lang, to_lang, context)
+            translation = self.llm_provider.generate(prompt)
+            self._cache_store(key, translation)
+        
+        self._record_translation(message, translation, from_lang, to_lang, context)
+        return translation
+    
+    async def translate_async(
+        self,
+        message: str,
+        from_language: Optional[str] = None,
+        to_language: Optional[str] = None,
+        context: Optional[str] = None
+    ) -> str:
+        """Translate a message without blocking the event loop.
+        
+        Args:
+            message: The message to translate
+            from_language: Source language (uses source_language if not provided)
+            to_language: Target language (uses target_language if not provided)
+            context: Additional context for translation
+            
+        Returns:
+            Translated message
+        """
+        from_lang = from_language or self.source_language
+        to_lang = to_language or self.target_language
+        
+        key = self._cache_key(message, from_lang, to_lang, context)
+        translation = self._cache_lookup(key)
+        if translation is None:
+            prompt = self._build_translation_prompt(message, from_lang, to_lang, context)
+            translation = await agenerate_from(self.llm_provider, prompt)
+            self._cache_store(key, translation)
+        
+        self._record_translation(message, translation, from_lang, to_lang, context)
+        return translation
+    
+    def _cache_key(
+        self,
+        message: str,
+        from_language: str,
+        to_language: str,
+        context: Optional[str] = None
+    ) -> str:
+        """Build the cache key for a translation request.
+        
+        The key covers the provider and model and everything that goes into the
+        prompt, so a hit is only possible when the same LLM would receive exactly
+        the same request, even in a cache shared between interpreters.
+        """
+        raw = "|".join((
+            self._provider_identity(),
+            from_language,
+            to_language,
+            self.translation_brief,
+            context or "",
+            message
+        ))
+        return hashlib.md5(raw.encode("utf-8")).hexdigest()
+    
+    def _provider_identity(self) -> str:
+        """Identify the provider and model answering this interpreter's requests."""
+        provider = self.llm_provider
+        get_name = getattr(provider, "get_provider_name", None)
+        name = get_name() if get_name is not None else type(provider).__qualname__
+        return f"{name}/{getattr(provider, 'model_name', '')}"
+    
+    def _cache_lookup(self, key: str) -> Optional[str]:
+        """Return a cached translation, or None if caching is off or on a miss."""
+        if not self.use_cache:
+            return None
+        return self.cache.get(key)
+    
+    def _cache_store(self, key: str, translation: str) -> None:
+        """Store a translation if caching is enabled."""
+        if self.use_cache:
+            self.cache.put(key, translation)
+    
+    def cache_clear(self) -> None:
+        """Drop all cached translations."""
+        self.cache.clear()
+    
+    def _record_translation(
+        self,
+        message: str,
+        translation: str,
+        from_language: str,
+        to_language: str,
+        context: Optional[str] = None
+    ) -> None:
+        """Append a translation to the history.
         
-        # Record translation
+        Args:
+            message: Original message
+            translation: Translated message
+            from_language: Source language
+            to_language: Target language
+            context: Optional context used for the translation
+        """
         self.translation_history.append({
             "original": message,
             "translation": translation,
-            "from": from_lang,
-            "to": to_lang,
+            "from": from_language,
+            "to": to_language,
             "context": context
         })
-        
-        return translation
     
     def _build_translation_prompt(
         self,
@@ -87,31 +206,245 @@ class InterpreterAgent:
         Returns:
             Formatted translation prompt
         """
+        header, footer = self._prompt_frame(from_language, to_language)
+        if context:
+            return f"{header}\nContext: {context}\n\nMessage to translate: {message}{footer}"
+        return f"{header}\n\nMessage to translate: {message}{footer}"
+    
+    def _prompt_frame(self, from_language: str, to_language: str) -> Tuple[str, str]:
+        """Get the parts of a translation prompt around the context and message.
+        
+        These only depend on the brief and the language pair, so they are built
+        once per pair instead of on every translation.
+        
+        Args:
+            from_language: Source language
+            to_language: Target language
+            
+        Returns:
+            Tuple of (header, footer) strings
+        """
+        key = (self.translation_brief, from_language, to_language)
+        frame = self._prompt_frames.get(key)
+        if frame is None:
+            frame = (
+                f"Translation Brief: {self.translation_brief}\n\n"
+                f"Translate the following message from {from_language} to {to_language}.",
+                f"\n\nTranslation ({to_language}):"
+            )
+            self._prompt_frames[key] = frame
+        return frame
+    
+    def _build_batch_prompt(
+        self,
+        messages: List[str],
+        from_language: str,
+        to_language: str,
+        contexts: List[Optional[str]]
+    ) -> str:
+        """Build a single prompt translating several numbered messages.
+        
+        Args:
+            messages: Messages to translate
+            from_language: Source language
+            to_language: Target language
+            contexts: Optional context for each message
+            
+        Returns:
+            Formatted batch translation prompt
+        """
         prompt_parts = [
             f"Translation Brief: {self.translation_brief}",
             "",
-            f"Translate the following message from {from_language} to {to_language}."
+            f"Translate each of the following numbered messages from {from_language} to {to_language}.",
+            "Reply with exactly one numbered line per message, using the same numbers, and nothing else."
         ]
         
-        if context:
-            prompt_parts.append(f"Context: {context}")
+        if any(contexts):
+            prompt_parts.extend(["", "Context for each message:"])
+            prompt_parts.extend(
+                f"{i}. {context or '-'}" for i, context in enumerate(contexts, start=1)
+            )
         
-        prompt_parts.extend([
-            "",
-            f"Message to translate: {message}",
-            "",
-            f"Translation ({to_language}):"
-        ])
+        prompt_parts.extend(["", "Messages to translate:"])
+        prompt_parts.extend(
+            f"{i}. {' '.join(message.splitlines())}"
+            for i, message in enumerate(messages, start=1)
+        )
+        prompt_parts.extend(["", f"Translations ({to_language}):"])
         
         return "\n".join(prompt_parts)
     
-    def get_translation_history(self) -> list:
+    @staticmethod
+    def _parse_batch_response(response: str, expected: int) -> Optional[List[str]]:
+        """Parse a numbered batch translation response.
+        
+        Args:
+            response: Raw LLM response
+            expected: Number of translations expected
+            
+        Returns:
+            Translations in message order, or None if the response doesn't contain
+            exactly one line for each number from 1 to ``expected``
+        """
+        translations = {}
+        for line in response.splitlines():
+            match = _NUMBERED_LINE.match(line)
+            if match:
+                translations[int(match.group(1))] = match.group(2)
+        
+        if sorted(translations) != list(range(1, expected + 1)):
+            return None
+        return [translations[i] for i in range(1, expected + 1)]
+    
+    def facilitate_batch(
+        self,
+        messages: List[str],
+        sender_language: str,
+        receiver_language: str,
+        contexts: Optional[List[Optional[str]]] = None
+    ) -> List[Dict[str, str]]:
+        """Translate several messages in the same direction with a single LLM request.
+        
+        Cached messages are skipped. If the response can't be matched back to the
+        messages, the remaining ones are translated one by one.
+        
+        Args:
+            messages: Messages from the sender
+            sender_language: Language of the sender
+            receiver_language: Language of the receiver
+            contexts: Optional context for each message
+            
+        Returns:
+            List of dictionaries with original and translated messages
+        """
+        contexts = contexts or [None] * len(messages)
+        keys, translations, missing = self._batch_lookup(
+            messages, sender_language, receiver_language, contexts
+        )
+        
+        if len(missing) > 1:
+            prompt = self._build_batch_prompt(
+                [messages[i] for i in missing],
+                sender_language,
+                receiver_language,
+                [contexts[i] for i in missing]
+            )
+            parsed = self._parse_batch_response(self.llm_provider.generate(prompt), len(missing))
+            if parsed is not None:
+                for i, translation in zip(missing, parsed):
+                    translations[i] = translation
+        
+        for i in missing:
+            if translations[i] is None:
+                prompt = self._build_translation_prompt(
+                    messages[i], sender_language, receiver_language, contexts[i]
+                )
+                translations[i] = self.llm_provider.generate(prompt)
+        
+        return self._finish_batch(
+            messages, translations, keys, missing, sender_language, receiver_language, contexts
+        )
+    
+    async def facilitate_batch_async(
+        self,
+        messages: List[str],
+        sender_language: str,
+        receiver_language: str,
+        contexts: Optional[List[Optional[str]]] = None
+    ) -> List[Dict[str, str]]:
+        """Translate several messages with a single LLM request without blocking the event loop.
+        
+        Args:
+            messages: Messages from the sender
+            sender_language: Language of the sender
+            receiver_language: Language of the receiver
+            contexts: Optional context for each message
+            
+        Returns:
+            List of dictionaries with original and translated messages
+        """
+        contexts = contexts or [None] * len(messages)
+        keys, translations, missing = self._batch_lookup(
+            messages, sender_language, receiver_language, contexts
+        )
+        
+        if len(missing) > 1:
+            prompt = self._build_batch_prompt(
+                [messages[i] for i in missing],
+                sender_language,
+                receiver_language,
+                [contexts[i] for i in missing]
+            )
+            response = await agenerate_from(self.llm_provider, prompt)
+            parsed = self._parse_batch_response(response, len(missing))
+            if parsed is not None:
+                for i, translation in zip(missing, parsed):
+                    translations[i] = translation
+        
+        for i in missing:
+            if translations[i] is None:
+                prompt = self._build_translation_prompt(
+                    messages[i], sender_language, receiver_language, contexts[i]
+                )
+                translations[i] = await agenerate_from(self.llm_provider, prompt)
+        
+        return self._finish_batch(
+            messages, translations, keys, missing, sender_language, receiver_language, contexts
+        )
+    
+    def _batch_lookup(
+        self,
+        messages: List[str],
+        from_language: str,
+        to_language: str,
+        contexts: List[Optional[str]]
+    ) -> Tuple[List[str], List[Optional[str]], List[int]]:
+        """Resolve cached translations for a batch.
+        
+        Returns:
+            Tuple of (cache keys, translations with None for misses, indices of misses)
+        """
+        keys = [
+            self._cache_key(message, from_language, to_language, context)
+            for message, context in zip(messages, contexts)
+        ]
+        translations = [self._cache_lookup(key) for key in keys]
+        missing = [i for i, translation in enumerate(translations) if translation is None]
+        return keys, translations, missing
+    
+    def _finish_batch(
+        self,
+        messages: List[str],
+        translations: List[str],
+        keys: List[str],
+        missing: List[int],
+        from_language: str,
+        to_language: str,
+        contexts: List[Optional[str]]
+    ) -> List[Dict[str, str]]:
+        """Cache new translations, record the batch and build the result dictionaries."""
+        for i in missing:
+            self._cache_store(keys[i], translations[i])
+        
+        results = []
+        for message, translation, context in zip(messages, translations, contexts):
+            self._record_translation(message, translation, from_language, to_language, context)
+            results.append({
+                "original": message,
+                "original_language": from_language,
+                "translation": translation,
+                "translation_language": to_language
+            })
+        return results
+    
+    def get_translation_history(self) -> List[Dict[str, Any]]:
         """Get the translation history.
         
         Returns:
-            List of translation records
+            List of translation records, oldest first
         """
-        return self.translation_history
+        return list(self.translation_history)
     
     def facilitate_conversation(
         self,
@@ -144,3 +477,35 @@ class InterpreterAgent:
             "translation": translation,
             "translation_language": receiver_language
         }
+    
+    async def facilitate_conversation_async(
+        self,
+        message: str,
+        sender_language: str,
+        receiver_language: str,
+        context: Optional[str] = None
+    ) -> Dict[str, str]:
+        """Facilitate a bidirectional conversation without blocking the event loop.
+        
+        Args:
+            message: Message from sender
+            sender_language: Language of the sender
+            receiver_language: Language of the receiver
+            context: Optional context
+            
+        Returns:
+            Dictionary with original and translated messages
+        """
+        translation = await self.translate_async(
+            message,
+            from_language=sender_language,
+            to_language=receiver_language,
+            context=context
+        )
+        
+        return {
+            "original": message,
+            "original_language": sender_language,
+            "translation": translation,
+            "translation_language": receiver_language
+        }
@@ -1,7 +1,10 @@
-"""Models module for data structures (placeholder for future extensions)."""
+"""Models module for data structures."""
+
+from .turn import Turn
 
 # This module can be extended with data classes for:
-# - Conversation turns
 # - Evaluation metrics
 # - Translation quality scores
 # etc.
+
+__all__ = ["Turn"]
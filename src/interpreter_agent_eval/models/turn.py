@@ -0,0 +1,45 @@
+"""Record of a single conversation turn."""
+
+from dataclasses import dataclass, fields
+from typing import Any, Dict
+
+
+@dataclass(slots=True, frozen=True)
+class Turn:
+    """One turn of an evaluated conversation.
+    
+    Slotted so that per-turn records carry no instance ``__dict__``.
+    
+    Attributes:
+        turn: 1-based turn number
+        timestamp_ns: Time the turn started, in nanoseconds since the epoch
+        from_user: Name of the sending user
+        to_user: Name of the receiving user
+        original_message: Message as sent
+        original_language: Language of the sent message
+        translated_message: Interpreter's translation
+        translated_language: Language of the translation
+        translation_time: Time spent translating, in seconds
+    """
+    turn: int
+    timestamp_ns: int
+    from_user: str
+    to_user: str
+    original_message: str
+    original_language: str
+    translated_message: str
+    translated_language: str
+    translation_time: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the turn to a dictionary, e.g. for serialization.
+        
+        Unlike ``dataclasses.asdict``, this doesn't deep-copy the values.
+        
+        Returns:
+            Dictionary of the turn's fields, in declaration order
+        """
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
+
+
+_FIELD_NAMES = tuple(field.name for field in fields(Turn))
@@ -1,15 +1,47 @@
 """LLM Provider base class and implementations."""
 
-from .base import LLMProvider
-from .google_ai import GoogleAIProvider
-from .openai import OpenAIProvider
-from .openrouter import OpenRouterProvider
-from .vllm import VLLMProvider
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._client_cache import aclose_async_clients, close_shared_clients
+    from .base import LLMProvider
+    from .google_ai import GoogleAIProvider
+    from .openai import OpenAIProvider
+    from .openrouter import OpenRouterProvider
+    from .vllm import VLLMProvider
 
 __all__ = [
     "LLMProvider",
     "GoogleAIProvider",
     "OpenAIProvider",
     "OpenRouterProvider",
-    "VLLMProvider"
+    "VLLMProvider",
+    "aclose_async_clients",
+    "close_shared_clients"
 ]
+
+# Providers are imported on first access (PEP 562), so using one doesn't
+# load the modules of all the others
+_LAZY_IMPORTS = {
+    "LLMProvider": ".base",
+    "GoogleAIProvider": ".google_ai",
+    "OpenAIProvider": ".openai",
+    "OpenRouterProvider": ".openrouter",
+    "VLLMProvider": ".vllm",
+    "aclose_async_clients": "._client_cache",
+    "close_shared_clients": "._client_cache",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
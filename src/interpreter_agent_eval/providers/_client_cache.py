@@ -0,0 +1,217 @@
+"""Process-wide cache of SDK clients shared between providers."""
+
+import asyncio
+import importlib.util
+import threading
+import weakref
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+# Clients keyed by (base_url, api_key, max_retries); each holds its own HTTP
+# connection pool
+_clients: Dict[Tuple[Optional[str], Optional[str], Optional[int]], Any] = {}
+# Async clients per event loop, since their connections can't outlive the loop,
+# each stored with the coroutine function closing it. Next to a loop's clients
+# is the async generator closing them when the loop shuts down (see
+# _close_at_shutdown); the clients keep their loop alive, so the entry must be
+# removed for the loop to be collected.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[Dict[Tuple, Tuple[Any, Callable[[Any], Awaitable[None]]]], AsyncGenerator[None, None]]]" = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+# HTTP/2 lets concurrent requests share one connection, but httpx needs the
+# optional h2 package for it
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def get_openai_client(
+    api_key: Optional[str],
+    base_url: Optional[str] = None,
+    max_retries: Optional[int] = None
+) -> Any:
+    """Get the shared OpenAI client for an endpoint and API key.
+    
+    Providers configured with the same endpoint and key reuse one client, and
+    with it the open connections, instead of each performing its own TCP and
+    TLS handshakes. The client speaks HTTP/2 when h2 is installed.
+    
+    Args:
+        api_key: API key for the endpoint
+        base_url: Base URL of an OpenAI-compatible API (OpenAI's if not provided)
+        max_retries: Retries of failed requests (the SDK's default if not provided)
+        
+    Returns:
+        ``openai.OpenAI`` client instance
+        
+    Raises:
+        ImportError: If the OpenAI SDK is not installed
+    """
+    key = (base_url, api_key, max_retries)
+    client = _clients.get(key)
+    if client is None:
+        with _lock:
+            client = _clients.get(key)
+            if client is None:
+                from openai import DefaultHttpxClient, OpenAI
+                client = OpenAI(
+                    api_key=api_key,
+                    base_url=base_url,
+                    http_client=DefaultHttpxClient(http2=True) if _HTTP2 else None,
+                    **_retry_options(max_retries)
+                )
+                _clients[key] = client
+    return client
+
+
+def pick_round_robin(items: Sequence[Any], counter: Iterator[int]) -> Any:
+    """Pick the next item of a round-robin rotation.
+    
+    Args:
+        items: Non-empty sequence to rotate over
+        counter: ``itertools.count()`` owned by the caller; advancing it is
+            atomic, so threads can share a rotation without a lock
+            
+    Returns:
+        The next item
+    """
+    if len(items) == 1:
+        return items[0]
+    return items[next(counter) % len(items)]
+
+
+def close_shared_clients() -> None:
+    """Close the shared sync clients and their pooled connections.
+    
+    Providers look their clients up on every request, so ones used afterwards
+    get new clients and connections. Async clients are closed per event loop
+    by :func:`aclose_async_clients`.
+    """
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+def get_async_client(
+    key: Tuple,
+    factory: Callable[[], Any],
+    aclose: Optional[Callable[[Any], Awaitable[None]]] = None
+) -> Any:
+    """Get a shared async client for the running event loop.
+    
+    Async HTTP connections are bound to the loop that opened them, so clients
+    are shared per loop. They are closed when the loop shuts down its async
+    generators, which ``asyncio.run`` does before closing the loop, or earlier
+    by :func:`aclose_async_clients`.
+    
+    Args:
+        key: Hashable identifier of the client configuration
+        factory: Function creating the client on first use in a loop
+        aclose: Coroutine function closing the client (its ``close()`` method
+            if not provided)
+            
+    Returns:
+        Client instance created by ``factory``
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        loop_entry = _async_clients.get(loop)
+        if loop_entry is None:
+            clients = {}
+            loop_entry = _async_clients[loop] = (clients, _close_at_shutdown(clients))
+            # Start the generator, so the loop tracks it and closes it at shutdown;
+            # it yields right away, so this completes without suspending
+            try:
+                loop_entry[1].asend(None).send(None)
+            except StopIteration:
+                pass
+        clients = loop_entry[0]
+        entry = clients.get(key)
+        if entry is None:
+            entry = clients[key] = (factory(), aclose or _aclose)
+    return entry[0]
+
+
+async def aclose_async_clients() -> None:
+    """Close the async clients created in the running event loop.
+    
+    Loops close their clients when they shut down their async generators, as
+    ``asyncio.run`` does. Await this to close them earlier, or before closing
+    a loop that is managed by hand without ``shutdown_asyncgens()``; clients
+    requested afterwards are created anew.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        loop_entry = _async_clients.get(loop)
+    if loop_entry is not None:
+        await loop_entry[1].aclose()
+
+
+async def _close_at_shutdown(
+    clients: Dict[Tuple, Tuple[Any, Callable[[Any], Awaitable[None]]]]
+) -> AsyncGenerator[None, None]:
+    """Async generator closing a loop's clients once it is closed itself.
+    
+    Event loops close the async generators still open when they shut down,
+    running the ``finally`` block below in the loop.
+    
+    Args:
+        clients: The loop's entry of ``_async_clients``
+    """
+    try:
+        yield
+    finally:
+        loop = asyncio.get_running_loop()
+        with _lock:
+            loop_entry = _async_clients.get(loop)
+            if loop_entry is not None and loop_entry[0] is clients:
+                del _async_clients[loop]
+            entries = list(clients.values())
+            clients.clear()
+        for client, aclose in entries:
+            await aclose(client)
+
+
+async def _aclose(client: Any) -> None:
+    """Close an async client through its ``close()`` coroutine, e.g. ``AsyncOpenAI``."""
+    await client.close()
+
+
+def get_async_openai_client(
+    api_key: Optional[str],
+    base_url: Optional[str] = None,
+    max_retries: Optional[int] = None
+) -> Any:
+    """Get the shared ``openai.AsyncOpenAI`` client for an endpoint in the running loop.
+    
+    Args:
+        api_key: API key for the endpoint
+        base_url: Base URL of an OpenAI-compatible API (OpenAI's if not provided)
+        max_retries: Retries of failed requests (the SDK's default if not provided)
+        
+    Returns:
+        ``openai.AsyncOpenAI`` client instance
+        
+    Raises:
+        ImportError: If the OpenAI SDK is not installed
+    """
+    def create():
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+        return AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=DefaultAsyncHttpxClient(http2=True) if _HTTP2 else None,
+            **_retry_options(max_retries)
+        )
+    
+    return get_async_client(("openai", base_url, api_key, max_retries), create)
+
+
+def _retry_options(max_retries: Optional[int]) -> Dict[str, int]:
+    """Client options overriding the SDK's retry count, if one is given.
+    
+    The OpenAI SDK retries connection errors, timeouts, rate limits (429) and
+    server errors (5xx) with exponential backoff and jitter.
+    """
+    return {} if max_retries is None else {"max_retries": max_retries}
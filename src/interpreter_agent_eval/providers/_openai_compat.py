@@ -0,0 +1,235 @@
+"""Shared implementation of providers speaking the OpenAI chat completions API."""
+
+import itertools
+import logging
+import time
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+from .base import LLMProvider, MetricsCallback, report_call
+from ._client_cache import get_async_openai_client, get_openai_client, pick_round_robin
+
+logger = logging.getLogger(__name__)
+
+# Seconds a prewarm request may take; prewarming is an optimization and must
+# not hold up construction for the SDK's full timeout and retries
+_PREWARM_TIMEOUT = 5.0
+
+
+class OpenAICompatibleProvider(LLMProvider):
+    """Base class of providers for OpenAI-compatible chat completion APIs.
+    
+    Implements generation, streaming and parameter handling on top of the
+    OpenAI SDK. Subclasses describe their endpoints, and requests are spread
+    over them round-robin.
+    """
+    
+    # Name used in error messages
+    _label = "OpenAI"
+    # Message of the ImportError raised when the OpenAI SDK is missing
+    _sdk_missing = "OpenAI SDK not installed. Install it with: pip install openai"
+    
+    def __init__(
+        self,
+        endpoints: Sequence[Tuple[Optional[str], Optional[str]]],
+        model_name: str,
+        max_retries: Optional[int] = None,
+        metrics_callback: Optional[MetricsCallback] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+        default_params: Optional[Dict[str, Any]] = None
+    ):
+        """Initialize the shared provider state.
+        
+        Args:
+            endpoints: (api_key, base_url) pairs to spread requests over; a base
+                URL of None means OpenAI's API
+            model_name: Model name
+            max_retries: Retries of failed requests (the SDK's default if not provided)
+            metrics_callback: Optional callback receiving the metrics of every API
+                call, see :func:`~.base.report_call`
+            extra_headers: Optional HTTP headers sent with every request
+            default_params: Default generation parameters
+        """
+        self.model_name = model_name
+        self.max_retries = max_retries
+        self.metrics_callback = metrics_callback
+        self.default_params = default_params or {}
+        self._endpoints = list(endpoints)
+        self._extra_headers = extra_headers or None
+        self._next_endpoint = itertools.count()
+    
+    def _client_for(self, endpoint: Tuple[Optional[str], Optional[str]]) -> Any:
+        """Get the shared sync client of an endpoint.
+        
+        Clients are looked up in the shared cache on every call rather than
+        kept, so providers pick up new clients after ``close_shared_clients()``.
+        """
+        api_key, base_url = endpoint
+        try:
+            return get_openai_client(api_key, base_url=base_url, max_retries=self.max_retries)
+        except ImportError:
+            raise ImportError(self._sdk_missing)
+    
+    def _prewarm(self) -> None:
+        """Establish a pooled connection with a cheap request to the models endpoint.
+        
+        Warms the shared sync clients, which blocking generation (and so
+        ``EvaluationFramework.run_conversation``) uses. Each request is tried once
+        with a short timeout; failures are logged and the first generation then
+        connects as usual.
+        """
+        for endpoint in self._endpoints:
+            client = self._client_for(endpoint)
+            try:
+                # A copy with other options still shares the client's connection pool
+                client.with_options(timeout=_PREWARM_TIMEOUT, max_retries=0).models.list()
+            except Exception as e:
+                logger.warning(
+                    "Prewarming the %s connection to %s failed: %s", self._label, client.base_url, e
+                )
+    
+    def _pick_client(self) -> Any:
+        """Get the client of the endpoint whose turn it is."""
+        return self._client_for(pick_round_robin(self._endpoints, self._next_endpoint))
+    
+    def _async_client(self) -> Any:
+        """Get the async client of the next endpoint, shared within the running loop."""
+        api_key, base_url = pick_round_robin(self._endpoints, self._next_endpoint)
+        try:
+            return get_async_openai_client(api_key, base_url=base_url, max_retries=self.max_retries)
+        except ImportError:
+            raise ImportError(self._sdk_missing)
+    
+    def generate(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> str:
+        """Generate text using the provider's API.
+        
+        Args:
+            prompt: Input prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional parameters
+            
+        Returns:
+            Generated text
+        """
+        client = self._pick_client()
+        params = self._build_params(max_tokens, temperature, kwargs)
+        
+        started = time.perf_counter()
+        try:
+            response = client.chat.completions.create(
+                model=self.model_name,
+                messages=[{"role": "user", "content": prompt}],
+                extra_headers=self._extra_headers,
+                **params
+            )
+        except Exception as e:
+            report_call(self, started, error=e)
+            raise RuntimeError(f"{self._label} generation failed: {str(e)}")
+        report_call(self, started, response)
+        return response.choices[0].message.content
+    
+    def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """Generate text using the provider's API, yielding it as it arrives.
+        
+        Lets callers start processing the beginning of a long response while the
+        rest is still being generated. ``"".join(...)`` of the chunks equals the
+        text :meth:`generate` returns.
+        
+        Args:
+            prompt: Input prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional parameters
+            
+        Yields:
+            Chunks of generated text
+        """
+        client = self._pick_client()
+        params = self._build_params(max_tokens, temperature, kwargs)
+        
+        started = time.perf_counter()
+        try:
+            stream = client.chat.completions.create(
+                model=self.model_name,
+                messages=[{"role": "user", "content": prompt}],
+                extra_headers=self._extra_headers,
+                stream=True,
+                **params
+            )
+            for chunk in stream:
+                # Some chunks (e.g. the final usage chunk) carry no content
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            report_call(self, started, error=e)
+            raise RuntimeError(f"{self._label} generation failed: {str(e)}")
+        report_call(self, started)
+    
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> str:
+        """Generate text using the provider's API with the SDK's native async client.
+        
+        Args:
+            prompt: Input prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional parameters
+            
+        Returns:
+            Generated text
+        """
+        client = self._async_client()
+        params = self._build_params(max_tokens, temperature, kwargs)
+        
+        started = time.perf_counter()
+        try:
+            response = await client.chat.completions.create(
+                model=self.model_name,
+                messages=[{"role": "user", "content": prompt}],
+                extra_headers=self._extra_headers,
+                **params
+            )
+        except Exception as e:
+            report_call(self, started, error=e)
+            raise RuntimeError(f"{self._label} generation failed: {str(e)}")
+        report_call(self, started, response)
+        return response.choices[0].message.content
+    
+    def _build_params(
+        self,
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Merge the default parameters with those of a single call.
+        
+        Without per-call overrides the defaults are used as they are, without
+        copying them.
+        """
+        if max_tokens is None and temperature is None and not kwargs:
+            return self.default_params
+        
+        overrides = {}
+        if max_tokens is not None:
+            overrides['max_tokens'] = max_tokens
+        if temperature is not None:
+            overrides['temperature'] = temperature
+        if not kwargs:
+            return self.default_params | overrides
+        return self.default_params | overrides | kwargs
@@ -1,7 +1,15 @@
 """Base LLM Provider class."""
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Callable, List, Optional, Sequence
+
+# Receives (provider name, model name, prompt tokens, completion tokens,
+# latency in milliseconds, error) after every API call of a provider
+MetricsCallback = Callable[
+    [str, str, Optional[int], Optional[int], float, Optional[Exception]], None
+]
 
 
 class LLMProvider(ABC):
@@ -28,6 +36,69 @@ class LLMProvider(ABC):
         """
         pass
     
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> str:
+        """Asynchronously generate text from the LLM.
+        
+        The default implementation runs :meth:`generate` in a worker thread so
+        every provider can be awaited. Providers with a native async SDK should
+        override this.
+        
+        Args:
+            prompt: The input prompt
+            max_tokens: Maximum number of tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional provider-specific parameters
+            
+        Returns:
+            Generated text
+        """
+        return await asyncio.to_thread(
+            self.generate,
+            prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs
+        )
+    
+    async def agenerate_many(
+        self,
+        prompts: Sequence[str],
+        concurrency: int = 16,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> List[str]:
+        """Generate text for several independent prompts concurrently.
+        
+        Args:
+            prompts: Input prompts
+            concurrency: Maximum number of requests in flight at once
+            max_tokens: Maximum number of tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional provider-specific parameters
+            
+        Returns:
+            Generated text for each prompt, in the order of ``prompts``
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def generate_one(prompt: str) -> str:
+            async with semaphore:
+                return await self.agenerate(
+                    prompt,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    **kwargs
+                )
+        
+        return await asyncio.gather(*(generate_one(prompt) for prompt in prompts))
+    
     @abstractmethod
     def get_provider_name(self) -> str:
         """Get the name of the provider.
@@ -36,3 +107,54 @@ class LLMProvider(ABC):
             Provider name
         """
         pass
+
+
+async def agenerate_from(provider: Any, prompt: str, **kwargs) -> str:
+    """Await a generation from any provider-like object.
+    
+    Uses the provider's ``agenerate`` when available and otherwise falls back to
+    running its synchronous ``generate`` in a worker thread, so duck-typed
+    providers (e.g. simple mocks) work on the async path too.
+    
+    Args:
+        provider: Provider instance exposing ``generate`` (and optionally ``agenerate``)
+        prompt: The input prompt
+        **kwargs: Additional generation parameters
+        
+    Returns:
+        Generated text
+    """
+    agenerate = getattr(provider, "agenerate", None)
+    if agenerate is not None:
+        return await agenerate(prompt, **kwargs)
+    return await asyncio.to_thread(provider.generate, prompt, **kwargs)
+
+
+def report_call(
+    provider: Any,
+    started: float,
+    response: Any = None,
+    error: Optional[Exception] = None
+) -> None:
+    """Pass the outcome of one API call to the provider's ``metrics_callback``.
+    
+    Does nothing when the provider has no callback set.
+    
+    Args:
+        provider: Provider that made the call
+        started: ``time.perf_counter()`` reading taken just before the call
+        response: API response, whose ``usage`` supplies the token counts if present
+        error: Exception the call failed with, if any
+    """
+    callback = getattr(provider, "metrics_callback", None)
+    if callback is None:
+        return
+    usage = getattr(response, "usage", None)
+    callback(
+        provider.get_provider_name(),
+        provider.model_name,
+        getattr(usage, "prompt_tokens", None),
+        getattr(usage, "completion_tokens", None),
+        (time.perf_counter() - started) * 1000,
+        error
+    )
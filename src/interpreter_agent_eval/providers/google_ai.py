@@ -1,7 +1,23 @@
 """Google AI Studio provider implementation."""
 
-from typing import Optional
+from typing import Any, Dict, Iterator, Optional
 from .base import LLMProvider
+from ._client_cache import get_async_client
+from ..utils.cache import LRUCache
+
+try:
+    from google import genai
+    from google.genai import types
+except ImportError:  # reported when a client is created
+    genai = types = None
+
+
+async def _aclose_client(client: Any) -> None:
+    """Close the async connections of a per-loop google-genai client."""
+    # Older google-genai releases have no way to close the async client
+    aclose = getattr(client.aio, "aclose", None)
+    if aclose is not None:
+        await aclose()
 
 
 class GoogleAIProvider(LLMProvider):
@@ -27,22 +43,25 @@ class GoogleAIProvider(LLMProvider):
         self.model_name = model_name
         self.default_params = default_params
         self._client = None
+        # Generation configs by call parameters, see _build_config
+        self._config_cache = LRUCache(maxsize=64)
     
     def _initialize_client(self):
         """Lazy initialization of the Google AI client."""
         if self._client is None:
-            try:
-                from google import genai
-                # Client gets API key from GEMINI_API_KEY env var if not provided
-                if self.api_key:
-                    self._client = genai.Client(api_key=self.api_key)
-                else:
-                    self._client = genai.Client()
-            except ImportError:
-                raise ImportError(
-                    "Google Generative AI SDK not installed. "
-                    "Install it with: pip install google-genai"
-                )
+            self._client = self._create_client()
+    
+    def _create_client(self) -> Any:
+        """Create a Google AI client."""
+        if genai is None:
+            raise ImportError(
+                "Google Generative AI SDK not installed. "
+                "Install it with: pip install google-genai"
+            )
+        # Client gets API key from GEMINI_API_KEY env var if not provided
+        if self.api_key:
+            return genai.Client(api_key=self.api_key)
+        return genai.Client()
     
     def generate(
         self,
@@ -63,35 +82,79 @@ class GoogleAIProvider(LLMProvider):
             Generated text
         """
         self._initialize_client()
+        config = self._build_config(max_tokens, temperature, kwargs)
         
-        # Build generation config
-        from google.genai import types
+        try:
+            response = self._client.models.generate_content(
+                model=self.model_name,
+                contents=prompt,
+                config=config
+            )
+            return response.text
+        except Exception as e:
+            raise RuntimeError(f"Google AI generation failed: {str(e)}")
+    
+    def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """Generate text using Google AI Studio, yielding it as it arrives.
         
-        config_params = {**self.default_params}
-        if temperature is not None:
-            config_params['temperature'] = temperature
-        if max_tokens is not None:
-            config_params['max_output_tokens'] = max_tokens
+        Lets callers start processing the beginning of a long response while the
+        rest is still being generated. ``"".join(...)`` of the chunks equals the
+        text :meth:`generate` returns.
         
-        # Extract special parameters
-        system_instruction = kwargs.pop('system_instruction', None)
-        thinking_config = kwargs.pop('thinking_config', None)
+        Args:
+            prompt: Input prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional parameters (e.g., system_instruction, thinking_config)
+            
+        Yields:
+            Chunks of generated text
+        """
+        self._initialize_client()
+        config = self._build_config(max_tokens, temperature, kwargs)
         
-        # Add any remaining kwargs
-        config_params.update(kwargs)
+        try:
+            for chunk in self._client.models.generate_content_stream(
+                model=self.model_name,
+                contents=prompt,
+                config=config
+            ):
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            raise RuntimeError(f"Google AI generation failed: {str(e)}")
+    
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> str:
+        """Generate text using Google AI Studio with the SDK's native async client.
         
-        # Create config
-        if system_instruction or thinking_config:
-            config = types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                thinking_config=thinking_config,
-                **config_params
-            )
-        else:
-            config = types.GenerateContentConfig(**config_params)
+        Args:
+            prompt: Input prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional parameters (e.g., system_instruction, thinking_config)
+            
+        Returns:
+            Generated text
+        """
+        # The async client's connections belong to the running loop, so it is
+        # shared per loop rather than kept on the provider
+        client = get_async_client(("google", self.api_key), self._create_client, _aclose_client)
+        config = self._build_config(max_tokens, temperature, kwargs)
         
         try:
-            response = self._client.models.generate_content(
+            response = await client.aio.models.generate_content(
                 model=self.model_name,
                 contents=prompt,
                 config=config
@@ -100,6 +163,82 @@ class GoogleAIProvider(LLMProvider):
         except Exception as e:
             raise RuntimeError(f"Google AI generation failed: {str(e)}")
     
+    def _build_config(
+        self,
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        kwargs: Dict[str, Any]
+    ) -> Any:
+        """Get the generation config of a single call.
+        
+        Configs are validated models in google-genai, so they are cached and
+        reused for calls with the same parameters. Calls with unhashable
+        parameter values get a fresh config.
+        
+        Args:
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            kwargs: Additional parameters (e.g., system_instruction, thinking_config)
+            
+        Returns:
+            ``GenerateContentConfig`` instance
+        """
+        try:
+            key = (
+                max_tokens,
+                temperature,
+                tuple(self.default_params.items()),
+                tuple(kwargs.items())
+            )
+            config = self._config_cache.get(key)
+        except TypeError:
+            return self._create_config(max_tokens, temperature, kwargs)
+        
+        if config is None:
+            config = self._create_config(max_tokens, temperature, kwargs)
+            self._config_cache.put(key, config)
+        return config
+    
+    def _create_config(
+        self,
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        kwargs: Dict[str, Any]
+    ) -> Any:
+        """Create the generation config of a single call.
+        
+        Args:
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            kwargs: Additional parameters (e.g., system_instruction, thinking_config)
+            
+        Returns:
+            ``GenerateContentConfig`` instance
+        """
+        # Extract special parameters
+        system_instruction = kwargs.pop('system_instruction', None)
+        thinking_config = kwargs.pop('thinking_config', None)
+        
+        # Only copy the defaults when the call overrides some of them
+        config_params = self.default_params
+        if temperature is not None or max_tokens is not None or kwargs:
+            config_params = {**config_params}
+            if temperature is not None:
+                config_params['temperature'] = temperature
+            if max_tokens is not None:
+                config_params['max_output_tokens'] = max_tokens
+            # Add any remaining kwargs
+            config_params.update(kwargs)
+        
+        # Create config
+        if system_instruction or thinking_config:
+            return types.GenerateContentConfig(
+                system_instruction=system_instruction,
+                thinking_config=thinking_config,
+                **config_params
+            )
+        return types.GenerateContentConfig(**config_params)
+    
     def get_provider_name(self) -> str:
         """Get provider name."""
         return f"Google AI Studio ({self.model_name})"
@@ -1,97 +1,72 @@
 """OpenRouter provider implementation."""
 
-from typing import Optional
-from .base import LLMProvider
+from typing import Optional, Sequence, Union
+from .base import MetricsCallback
+from ._openai_compat import OpenAICompatibleProvider
 
+_BASE_URL = "https://openrouter.ai/api/v1"
 
-class OpenRouterProvider(LLMProvider):
+
+class OpenRouterProvider(OpenAICompatibleProvider):
     """OpenRouter API provider for accessing various models."""
     
+    _label = "OpenRouter"
+    _sdk_missing = (
+        "OpenAI SDK not installed (required for OpenRouter). "
+        "Install it with: pip install openai"
+    )
+    
     def __init__(
         self,
-        api_key: str,
+        api_key: Union[str, Sequence[str]],
         model_name: str,
         site_url: Optional[str] = None,
         app_name: Optional[str] = None,
+        prewarm: bool = False,
+        max_retries: Optional[int] = None,
+        metrics_callback: Optional[MetricsCallback] = None,
         **default_params
     ):
         """Initialize OpenRouter provider.
         
         Args:
-            api_key: OpenRouter API key
+            api_key: OpenRouter API key, or several keys to spread requests over
+                round-robin, e.g. to multiply per-key rate limits
             model_name: Model identifier (e.g., 'anthropic/claude-2', 'meta-llama/llama-2-70b-chat')
             site_url: Optional site URL for attribution
             app_name: Optional app name for attribution
+            prewarm: Open the connection to OpenRouter right away, so the first
+                generation doesn't pay for the TLS handshake
+            max_retries: Number of retries, with exponential backoff, of requests
+                failing with rate limits, timeouts, connection or server errors.
+                Uses the OpenAI SDK's default if not provided.
+            metrics_callback: Called after every API call with the provider and
+                model names, prompt and completion tokens (None if unknown), the
+                latency in milliseconds and the error the call failed with, if any
             **default_params: Default generation parameters
         """
-        self.api_key = api_key
-        self.model_name = model_name
+        self.api_keys = [api_key] if isinstance(api_key, str) else list(api_key)
+        if not self.api_keys:
+            raise ValueError("OpenRouter needs at least one API key")
+        self.api_key = self.api_keys[0]
         self.site_url = site_url
         self.app_name = app_name
-        self.default_params = default_params
-        self._client = None
-    
-    def _initialize_client(self):
-        """Lazy initialization of the OpenRouter client."""
-        if self._client is None:
-            try:
-                from openai import OpenAI
-                # OpenRouter uses OpenAI-compatible API
-                self._client = OpenAI(
-                    base_url="https://openrouter.ai/api/v1",
-                    api_key=self.api_key
-                )
-            except ImportError:
-                raise ImportError(
-                    "OpenAI SDK not installed (required for OpenRouter). "
-                    "Install it with: pip install openai"
-                )
-    
-    def generate(
-        self,
-        prompt: str,
-        max_tokens: Optional[int] = None,
-        temperature: Optional[float] = None,
-        **kwargs
-    ) -> str:
-        """Generate text using OpenRouter API.
-        
-        Args:
-            prompt: Input prompt
-            max_tokens: Maximum tokens to generate
-            temperature: Sampling temperature
-            **kwargs: Additional parameters
-            
-        Returns:
-            Generated text
-        """
-        self._initialize_client()
-        
-        # Merge parameters
-        params = {**self.default_params}
-        if max_tokens is not None:
-            params['max_tokens'] = max_tokens
-        if temperature is not None:
-            params['temperature'] = temperature
-        params.update(kwargs)
-        
-        # Add OpenRouter-specific headers
+        # Attribution headers are fixed per provider, so build them once
         extra_headers = {}
-        if self.site_url:
-            extra_headers["HTTP-Referer"] = self.site_url
-        if self.app_name:
-            extra_headers["X-Title"] = self.app_name
-        
-        try:
-            response = self._client.chat.completions.create(
-                model=self.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                extra_headers=extra_headers if extra_headers else None,
-                **params
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            raise RuntimeError(f"OpenRouter generation failed: {str(e)}")
+        if site_url:
+            extra_headers["HTTP-Referer"] = site_url
+        if app_name:
+            extra_headers["X-Title"] = app_name
+        super().__init__(
+            [(key, _BASE_URL) for key in self.api_keys],
+            model_name,
+            max_retries=max_retries,
+            metrics_callback=metrics_callback,
+            extra_headers=extra_headers,
+            default_params=default_params
+        )
+        if prewarm:
+            self._prewarm()
     
     def get_provider_name(self) -> str:
         """Get provider name."""
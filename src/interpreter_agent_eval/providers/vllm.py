@@ -1,86 +1,63 @@
 """vLLM provider for HuggingFace models."""
 
-from typing import Optional
-from .base import LLMProvider
+from typing import Optional, Sequence, Union
+from .base import MetricsCallback
+from ._openai_compat import OpenAICompatibleProvider
 
 
-class VLLMProvider(LLMProvider):
+class VLLMProvider(OpenAICompatibleProvider):
     """vLLM provider for serving HuggingFace models."""
     
+    _label = "vLLM"
+    _sdk_missing = (
+        "OpenAI SDK not installed (required for vLLM client). "
+        "Install it with: pip install openai"
+    )
+    
     def __init__(
         self,
-        base_url: str,
+        base_url: Union[str, Sequence[str]],
         model_name: str,
         api_key: Optional[str] = None,
+        prewarm: bool = False,
+        max_retries: Optional[int] = None,
+        metrics_callback: Optional[MetricsCallback] = None,
         **default_params
     ):
         """Initialize vLLM provider.
         
         Args:
-            base_url: Base URL of the vLLM server (e.g., 'http://localhost:8000')
+            base_url: Base URL of the vLLM server (e.g., 'http://localhost:8000'), or
+                the URLs of several servers (replicas serving the same model) to
+                spread requests over round-robin
             model_name: Model name served by vLLM
             api_key: Optional API key if authentication is required
+            prewarm: Open the connection to the server right away, so the first
+                generation doesn't pay for connection setup
+            max_retries: Number of retries, with exponential backoff, of requests
+                failing with rate limits, timeouts, connection or server errors.
+                Uses the OpenAI SDK's default if not provided.
+            metrics_callback: Called after every API call with the provider and
+                model names, prompt and completion tokens (None if unknown), the
+                latency in milliseconds and the error the call failed with, if any
             **default_params: Default generation parameters
         """
-        self.base_url = base_url.rstrip('/')
-        self.model_name = model_name
+        base_urls = [base_url] if isinstance(base_url, str) else base_url
+        self.base_urls = [url.rstrip('/') for url in base_urls]
+        if not self.base_urls:
+            raise ValueError("vLLM needs at least one server base URL")
+        self.base_url = self.base_urls[0]
         self.api_key = api_key
-        self.default_params = default_params
-        self._client = None
-    
-    def _initialize_client(self):
-        """Lazy initialization of the vLLM client."""
-        if self._client is None:
-            try:
-                from openai import OpenAI
-                # vLLM provides OpenAI-compatible API
-                self._client = OpenAI(
-                    base_url=f"{self.base_url}/v1",
-                    api_key=self.api_key or "EMPTY"
-                )
-            except ImportError:
-                raise ImportError(
-                    "OpenAI SDK not installed (required for vLLM client). "
-                    "Install it with: pip install openai"
-                )
-    
-    def generate(
-        self,
-        prompt: str,
-        max_tokens: Optional[int] = None,
-        temperature: Optional[float] = None,
-        **kwargs
-    ) -> str:
-        """Generate text using vLLM server.
-        
-        Args:
-            prompt: Input prompt
-            max_tokens: Maximum tokens to generate
-            temperature: Sampling temperature
-            **kwargs: Additional parameters
-            
-        Returns:
-            Generated text
-        """
-        self._initialize_client()
-        
-        # Merge parameters
-        params = {**self.default_params}
-        if max_tokens is not None:
-            params['max_tokens'] = max_tokens
-        if temperature is not None:
-            params['temperature'] = temperature
-        params.update(kwargs)
-        
-        try:
-            response = self._client.chat.completions.create(
-                model=self.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                **params
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            raise RuntimeError(f"vLLM generation failed: {str(e)}")
+        # vLLM provides OpenAI-compatible API
+        super().__init__(
+            [(api_key or "EMPTY", f"{url}/v1") for url in self.base_urls],
+            model_name,
+            max_retries=max_retries,
+            metrics_callback=metrics_callback,
+            default_params=default_params
+        )
+        if prewarm:
+            self._prewarm()
     
     def get_provider_name(self) -> str:
         """Get provider name."""
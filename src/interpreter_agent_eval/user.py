@@ -1,7 +1,10 @@
 """User class for representing conversation participants."""
 
+import sys
 from typing import Optional, Dict, Any
 
+from .providers.base import agenerate_from
+
 
 class User:
     """Represents a user in the conversation with a specific language.
@@ -27,7 +30,9 @@ class User:
             context: Context information for the user
         """
         self.name = name
-        self.language = language
+        # Interned so that the language comparisons and lookups made every turn
+        # (prompt frames, cache keys) can short-circuit on identity
+        self.language = sys.intern(language)
         self.is_llm = is_llm
         self.llm_provider = llm_provider
         self.context = context
@@ -62,6 +67,32 @@ class User:
             })
             return message
     
+    async def send_message_async(
+        self,
+        message: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Send a message from this user without blocking the event loop.
+        
+        Args:
+            message: The message content
+            metadata: Optional metadata about the message
+            
+        Returns:
+            The message (potentially generated by LLM if is_llm is True)
+        """
+        if self.is_llm and self.llm_provider:
+            prompt = self._build_prompt(message)
+            response = await agenerate_from(self.llm_provider, prompt)
+            self.conversation_history.append({
+                "role": "assistant",
+                "content": response,
+                "metadata": metadata
+            })
+            return response
+        # Human users don't make any LLM call
+        return self.send_message(message, metadata)
+    
     def receive_message(self, message: str, metadata: Optional[Dict[str, Any]] = None):
         """Receive a message for this user.
         
@@ -1,5 +1,7 @@
 """Utility functions for the evaluation framework."""
 
+from .cache import LRUCache
 from .data_handler import DataHandler
+from .stats import RunningStats
 
-__all__ = ["DataHandler"]
+__all__ = ["DataHandler", "LRUCache", "RunningStats"]
@@ -0,0 +1,65 @@
+"""In-memory caching utilities for the evaluation framework."""
+
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class LRUCache:
+    """Bounded in-memory cache evicting the least recently used entries.
+    
+    A single instance can be shared by several interpreters (or frameworks) so
+    that identical requests are only sent to the LLM once.
+    """
+    
+    def __init__(self, maxsize: Optional[int] = 1024):
+        """Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries to keep (None for unbounded)
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Look up a cached value.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            The cached value, or None on a miss
+        """
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def put(self, key: str, value: Any) -> None:
+        """Store a value, evicting the oldest entry if the cache is full.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries and reset the hit/miss counters."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
@@ -2,9 +2,114 @@
 
 import json
 import csv
-from typing import List, Dict, Any, Optional
+import functools
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Callable, Iterator, List, Dict, Any, Optional, Tuple, TypeVar
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+
+# Absolute paths of directories already created by this process, so repeated
+# saves to the same directory skip the mkdir syscalls
+_ensured_dirs = set()
+
+
+def _open_output(filepath: str, mode: str = 'w', **kwargs) -> IO:
+    """Open a file for writing, creating its parent directory if needed.
+    
+    Directories are remembered by absolute path, so the cache stays correct
+    across ``os.chdir``. A remembered directory that has since been removed is
+    created again.
+    
+    Args:
+        filepath: Path of the file
+        mode: Mode to open the file in
+        **kwargs: Further arguments to ``open``
+        
+    Returns:
+        The open file
+    """
+    parent = os.path.dirname(os.path.abspath(filepath))
+    if parent not in _ensured_dirs:
+        os.makedirs(parent, exist_ok=True)
+        _ensured_dirs.add(parent)
+    try:
+        return open(filepath, mode, **kwargs)
+    except FileNotFoundError:
+        os.makedirs(parent, exist_ok=True)
+        return open(filepath, mode, **kwargs)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_text_cached(path: str, mtime_ns: int) -> str:
+    """Read a text file, memoized on its path and modification time.
+    
+    The modification time is part of the cache key, so an edited file is read
+    again instead of returning stale content.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _read_text(filepath: str) -> str:
+    """Read a text file through the mtime-aware cache."""
+    path = os.path.abspath(filepath)
+    return _read_text_cached(path, os.stat(path).st_mtime_ns)
+
+
+def _load_json(filepath: str) -> Any:
+    """Parse a JSON file from its raw bytes, using orjson when available."""
+    data = Path(filepath).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Stand-in for results saved without metrics
+_NO_METRICS: Dict[str, Any] = {}
+
+# Threads loading result files in parallel
+_LOAD_WORKERS = 32
+
+_T = TypeVar('_T')
+
+
+def _load_result(filepath: str) -> Tuple[int, float, Dict[str, Any]]:
+    """Load one result file and extract its turn count and total translation time."""
+    result = _load_json(filepath)
+    metrics = result.get('metrics') or _NO_METRICS
+    turns = metrics.get('total_turns', 0)
+    return turns, metrics.get('average_translation_time', 0) * turns, result
+
+
+def _load_totals(filepath: str) -> Tuple[int, float]:
+    """Load one result file and keep only its turn count and total translation time."""
+    turns, translation_time, _ = _load_result(filepath)
+    return turns, translation_time
+
+
+def _map_bounded(load: Callable[[str], _T], filepaths: List[str]) -> Iterator[_T]:
+    """Load files in parallel threads, yielding the results in order.
+    
+    At most twice as many files as there are threads are loaded ahead of the
+    consumer, so memory stays bounded however many files there are.
+    """
+    workers = min(_LOAD_WORKERS, len(filepaths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for filepath in filepaths:
+            pending.append(executor.submit(load, filepath))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
 
 class DataHandler:
     """Utility class for handling evaluation data."""
@@ -19,20 +124,43 @@ class DataHandler:
         Returns:
             Loaded conversation data
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _load_json(filepath)
     
     @staticmethod
-    def save_conversation_data(data: Dict[str, Any], filepath: str) -> None:
+    def save_conversation_data(
+        data: Dict[str, Any],
+        filepath: str,
+        indent: Optional[int] = None
+    ) -> None:
         """Save conversation data to a JSON file.
         
+        Uses orjson when it is installed and the standard library otherwise,
+        or for data orjson can't serialize (e.g. integers beyond 64 bits); both
+        produce UTF-8 output, compact unless an indent is requested. The data is
+        serialized before the file is opened, so a failure leaves it unchanged.
+        
         Args:
             data: Conversation data to save
             filepath: Path to save the file
+            indent: Spaces to indent nested values by, for files meant to be
+                read by people. Output is compact by default.
         """
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        payload = None
+        if orjson is not None and indent in (None, 2):
+            option = orjson.OPT_NON_STR_KEYS
+            if indent == 2:
+                option |= orjson.OPT_INDENT_2
+            try:
+                payload = orjson.dumps(data, option=option)
+            except TypeError:
+                pass
+        if payload is None:
+            separators = (',', ':') if indent is None else None
+            payload = json.dumps(
+                data, indent=indent, separators=separators, ensure_ascii=False
+            ).encode('utf-8')
+        with _open_output(filepath, 'wb') as f:
+            f.write(payload)
     
     @staticmethod
     def export_to_csv(
@@ -54,67 +182,76 @@ class DataHandler:
         if fields is None:
             fields = list(conversation_log[0].keys())
         
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fields)
-            writer.writeheader()
-            for turn in conversation_log:
-                row = {k: turn.get(k, '') for k in fields}
-                writer.writerow(row)
+        rows = (tuple(turn.get(k, '') for k in fields) for turn in conversation_log)
+        with _open_output(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(fields)
+            writer.writerows(rows)
     
     @staticmethod
     def load_translation_brief(filepath: str) -> str:
         """Load translation brief from a file.
         
+        Repeated loads of an unchanged file are served from memory.
+        
         Args:
             filepath: Path to the brief file
             
         Returns:
             Translation brief content
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return f.read()
+        return _read_text(filepath)
     
     @staticmethod
     def load_user_context(filepath: str) -> str:
         """Load user context from a file.
         
+        Repeated loads of an unchanged file are served from memory.
+        
         Args:
             filepath: Path to the context file
             
         Returns:
             User context content
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return f.read()
+        return _read_text(filepath)
     
     @staticmethod
-    def aggregate_results(result_files: List[str]) -> Dict[str, Any]:
+    def aggregate_results(
+        result_files: List[str],
+        return_individual: bool = True
+    ) -> Dict[str, Any]:
         """Aggregate results from multiple evaluation runs.
         
+        Files are read in parallel threads, a bounded number at a time, and
+        folded into the totals in the order given.
+        
         Args:
             result_files: List of paths to result JSON files
-            
+            return_individual: Whether to include every loaded result under
+                "evaluations". Pass False to keep only the totals in memory;
+                each result is then dropped as soon as its metrics are read.
+                
         Returns:
             Aggregated results
         """
+        total_turns = 0
+        total_translation_time = 0.0
         all_results = []
-        for filepath in result_files:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                all_results.append(json.load(f))
-        
-        # Calculate aggregate metrics
-        total_turns = sum(r.get('metrics', {}).get('total_turns', 0) for r in all_results)
-        total_translation_time = sum(
-            r.get('metrics', {}).get('average_translation_time', 0) *
-            r.get('metrics', {}).get('total_turns', 0)
-            for r in all_results
-        )
+        if result_files:
+            load = _load_result if return_individual else _load_totals
+            for loaded in _map_bounded(load, result_files):
+                total_turns += loaded[0]
+                total_translation_time += loaded[1]
+                if return_individual:
+                    all_results.append(loaded[2])
         avg_translation_time = total_translation_time / total_turns if total_turns > 0 else 0
         
-        return {
-            "num_evaluations": len(all_results),
+        aggregated = {
+            "num_evaluations": len(result_files),
             "total_turns": total_turns,
             "average_translation_time": avg_translation_time,
-            "evaluations": all_results
         }
+        if return_individual:
+            aggregated["evaluations"] = all_results
+        return aggregated
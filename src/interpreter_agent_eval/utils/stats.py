@@ -0,0 +1,46 @@
+"""Statistics helpers for the evaluation framework."""
+
+import math
+
+
+class RunningStats:
+    """Running mean and variance in constant memory (Welford's algorithm).
+    
+    Useful when values are consumed as they arrive, e.g. when conversation
+    turns are streamed to disk instead of kept in memory.
+    """
+    
+    def __init__(self):
+        """Initialize an empty accumulator."""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+    
+    def add(self, value: float) -> None:
+        """Add a value.
+        
+        Args:
+            value: The value to add
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+    
+    @property
+    def variance(self) -> float:
+        """Sample variance of the values added so far (0.0 for fewer than two)."""
+        if self.count < 2:
+            return 0.0
+        return self._m2 / (self.count - 1)
+    
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation of the values added so far."""
+        return math.sqrt(self.variance)
+    
+    def reset(self) -> None:
+        """Forget all values added so far."""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
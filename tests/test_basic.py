@@ -2,13 +2,15 @@
 
 import sys
 import os
+import asyncio
+import threading
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from interpreter_agent_eval import User, InterpreterAgent, EvaluationFramework
-from interpreter_agent_eval.providers.base import LLMProvider
-from interpreter_agent_eval.utils import DataHandler
+from interpreter_agent_eval.providers.base import LLMProvider, report_call
+from interpreter_agent_eval.utils import DataHandler, LRUCache, RunningStats
 
 
 class MockLLMProvider(LLMProvider):
@@ -17,9 +19,15 @@ class MockLLMProvider(LLMProvider):
     def __init__(self, response="Mock response"):
         self.response = response
         self.call_count = 0
+        # Calls may run concurrently in worker threads
+        self._lock = threading.Lock()
+    
+    def _count_call(self):
+        with self._lock:
+            self.call_count += 1
     
     def generate(self, prompt, max_tokens=None, temperature=None, **kwargs):
-        self.call_count += 1
+        self._count_call()
         return self.response
     
     def get_provider_name(self):
@@ -70,6 +78,8 @@ def test_interpreter_translation():
     """Test interpreter translation functionality."""
     print("Testing interpreter translation...")
     
+    import json
+    
     provider = MockLLMProvider(response="Hola, ¿cómo estás?")
     interpreter = InterpreterAgent(
         llm_provider=provider,
@@ -90,9 +100,96 @@ def test_interpreter_translation():
     assert history[0]["from"] == "eng"
     assert history[0]["to"] == "spa"
     
+    # Prompt layout, rebuilt when the brief changes
+    prompt = interpreter._build_translation_prompt("Hi", "eng", "spa", "Turn 1 of conversation")
+    assert prompt == (
+        "Translation Brief: Translate accurately\n\n"
+        "Translate the following message from eng to spa.\n"
+        "Context: Turn 1 of conversation\n\n"
+        "Message to translate: Hi\n\n"
+        "Translation (spa):"
+    )
+    interpreter.translation_brief = "Translate casually"
+    prompt = interpreter._build_translation_prompt("Hi", "spa", "eng")
+    assert prompt.startswith("Translation Brief: Translate casually\n\n")
+    assert "from spa to eng.\n\nMessage to translate: Hi\n\nTranslation (eng):" in prompt
+    
+    # A capped history keeps only the latest translations
+    interpreter = InterpreterAgent(provider, "Translate", "eng", "spa", history_maxlen=2)
+    for message in ["One", "Two", "Three"]:
+        interpreter.translate(message)
+    history = interpreter.get_translation_history()
+    assert [record["original"] for record in history] == ["Two", "Three"]
+    assert history[-1:] == [interpreter.translation_history[-1]]
+    assert json.loads(json.dumps(history)) == history
+    
     print("  ✓ Interpreter translation tests passed")
 
 
+def test_translation_cache():
+    """Test reuse of translations for identical requests."""
+    print("Testing translation cache...")
+    
+    provider = MockLLMProvider(response="Hola")
+    interpreter = InterpreterAgent(
+        llm_provider=provider,
+        translation_brief="Translate accurately",
+        source_language="eng",
+        target_language="spa"
+    )
+    
+    assert interpreter.translate("Hello") == "Hola"
+    assert interpreter.translate("Hello") == "Hola"
+    assert provider.call_count == 1
+    # Every translation is still recorded
+    assert len(interpreter.translation_history) == 2
+    
+    # Different context means a different prompt
+    interpreter.translate("Hello", context="Turn 2 of conversation")
+    assert provider.call_count == 2
+    
+    interpreter.cache_clear()
+    interpreter.translate("Hello")
+    assert provider.call_count == 3
+    
+    # Caching can be disabled
+    interpreter.use_cache = False
+    interpreter.translate("Hello")
+    assert provider.call_count == 4
+    
+    # Frameworks can share a cache between interpreters
+    shared_cache = LRUCache(maxsize=2)
+    provider = MockLLMProvider(response="Translation")
+    for i in range(3):
+        framework = EvaluationFramework(
+            User("Alice", "eng"),
+            User("Bob", "spa"),
+            InterpreterAgent(provider, "Translate", "eng", "spa"),
+            name=f"eval_{i}",
+            cache=shared_cache
+        )
+        framework.run_conversation(["Hello", "Hi"])
+    assert provider.call_count == 2
+    assert shared_cache.hits == 4
+    
+    # A shared cache never serves one provider's translation for another's
+    class OtherMockProvider(MockLLMProvider):
+        def get_provider_name(self):
+            return "Other Mock Provider"
+    
+    translations = [
+        InterpreterAgent(llm_provider, "Translate", "eng", "spa", cache=shared_cache).translate("Hello")
+        for llm_provider in (MockLLMProvider("gpt"), OtherMockProvider("claude"))
+    ]
+    assert translations == ["gpt", "claude"]
+    
+    # The cache is bounded
+    shared_cache.put("extra", "value")
+    assert len(shared_cache) == 2
+    
+    print("  ✓ Translation cache tests passed")
+
+
 def test_evaluation_framework():
     """Test evaluation framework orchestration."""
     print("Testing evaluation framework...")
@@ -121,16 +218,307 @@ def test_evaluation_framework():
     assert all('turn' in turn for turn in conversation)
     assert all('original_message' in turn for turn in conversation)
     assert all('translated_message' in turn for turn in conversation)
+    turns = list(framework.iter_turns())
+    assert [t.turn for t in turns] == [1, 2, 3]
+    assert turns[1].from_user == "Bob" and turns[1].original_message == "Hi there"
+    assert not hasattr(turns[0], '__dict__')
+    assert EvaluationFramework._export_turn(turns[0]) == conversation[0]
+    assert turns[0].to_dict()["timestamp_ns"] > 0
+    assert conversation[0]["timestamp"].endswith("+00:00")
+    assert framework.conversation_log == conversation
+    columns = framework.to_columns()
+    assert columns["original_message"] == messages
+    assert len(columns["translation_time"]) == 3
     
     # Evaluate
     metrics = framework.evaluate_translation_quality()
     assert 'total_turns' in metrics
     assert metrics['total_turns'] == 3
     assert 'average_translation_time' in metrics
+    assert metrics['min_translation_time'] <= metrics['p50_translation_time']
+    assert metrics['p50_translation_time'] <= metrics['p95_translation_time']
+    assert metrics['p95_translation_time'] <= metrics['max_translation_time']
+    
+    # Reset for a new session on the same framework
+    assert framework.reset(name="second_eval") is framework
+    assert framework.name == "second_eval"
+    assert framework.conversation_log == []
+    assert framework.metrics == {}
+    assert 'error' in framework.evaluate_translation_quality()
+    framework.run_conversation(["Bye"])
+    assert framework.evaluate_translation_quality()['total_turns'] == 1
+    
+    # Exports describe the participants as they are at export time
+    import tempfile
+    interpreter.translation_brief = "Translate casually"
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "results.json")
+        framework.export_results(path)
+        results = DataHandler.load_conversation_data(path)
+    assert results["interpreter"]["translation_brief"] == "Translate casually"
     
     print("  ✓ Evaluation framework tests passed")
 
 
+def test_batch_translation():
+    """Test translating pre-known messages in one request per sender."""
+    print("Testing batch translation...")
+    
+    class NumberedMockProvider(MockLLMProvider):
+        def generate(self, prompt, max_tokens=None, temperature=None, **kwargs):
+            self._count_call()
+            lines = prompt.split("Messages to translate:\n")[1].split("\n\n")[0]
+            return "\n".join(f"{line} (translated)" for line in lines.splitlines())
+    
+    provider = NumberedMockProvider()
+    interpreter = InterpreterAgent(provider, "Translate", "eng", "spa")
+    framework = EvaluationFramework(User("Alice", "eng"), User("Bob", "spa"), interpreter)
+    
+    conversation = framework.run_conversation(["Hello", "Hola", "Bye", "Adiós"], batch=True)
+    assert provider.call_count == 2
+    assert len(conversation) == 4
+    assert conversation[1]["from_user"] == "Bob"
+    assert conversation[1]["translated_message"] == "Hola (translated)"
+    assert conversation[2]["translated_message"] == "Bye (translated)"
+    assert conversation[2]["translated_language"] == "spa"
+    assert len(interpreter.translation_history) == 4
+    
+    # Unparseable batch responses fall back to one request per message
+    provider = MockLLMProvider(response="Translation")
+    interpreter = InterpreterAgent(provider, "Translate", "eng", "spa")
+    results = interpreter.facilitate_batch(["One", "Two"], "eng", "spa")
+    assert [r["translation"] for r in results] == ["Translation", "Translation"]
+    assert provider.call_count == 3
+    
+    print("  ✓ Batch translation tests passed")
+
+
+def test_run_conversation_async():
+    """Test running independent conversations concurrently."""
+    print("Testing async conversations...")
+    
+    class AsyncMockProvider(MockLLMProvider):
+        def __init__(self, response="Mock response"):
+            super().__init__(response)
+            self.in_flight = 0
+            self.max_in_flight = 0
+        
+        async def agenerate(self, prompt, max_tokens=None, temperature=None, **kwargs):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return self.generate(prompt)
+    
+    def build_framework(provider, name):
+        interpreter = InterpreterAgent(
+            llm_provider=provider,
+            translation_brief="Translate",
+            source_language="eng",
+            target_language="spa"
+        )
+        return EvaluationFramework(
+            User("Alice", "eng"), User("Bob", "spa"), interpreter, name=name
+        )
+    
+    async def run_all(frameworks, semaphore=None):
+        return await asyncio.gather(*(
+            fw.run_conversation_async(["Hello", "Hi"], semaphore=semaphore)
+            for fw in frameworks
+        ))
+    
+    # Independent frameworks overlap their LLM calls
+    provider = AsyncMockProvider(response="Hola")
+    frameworks = [build_framework(provider, f"eval_{i}") for i in range(2)]
+    logs = asyncio.run(run_all(frameworks))
+    assert [len(log) for log in logs] == [2, 2]
+    assert logs[0][1]["translated_message"] == "Hola"
+    assert provider.call_count == 4
+    assert provider.max_in_flight == 2
+    
+    # A shared semaphore bounds the number of in-flight calls
+    provider = AsyncMockProvider()
+    frameworks = [build_framework(provider, f"eval_{i}") for i in range(2)]
+    asyncio.run(run_all(frameworks, semaphore=asyncio.Semaphore(1)))
+    assert provider.max_in_flight == 1
+    
+    # Batch API over (framework, messages) sessions
+    provider = AsyncMockProvider(response="Hola")
+    frameworks = [build_framework(provider, f"eval_{i}") for i in range(3)]
+    logs = EvaluationFramework.run_conversations_batch(
+        [(fw, ["Hello"] * (i + 1)) for i, fw in enumerate(frameworks)],
+        max_concurrency=2
+    )
+    assert [len(log) for log in logs] == [1, 2, 3]
+    assert provider.max_in_flight == 2
+    
+    # The blocking API also works inside a running event loop, via generate()
+    async def run_blocking_in_loop():
+        framework = build_framework(provider, "eval_in_loop")
+        log = framework.run_conversation(["Hello"])
+        logs = EvaluationFramework.run_conversations_batch([(framework, ["Hi"])])
+        return log, logs
+    
+    provider = AsyncMockProvider(response="Hola")
+    log, logs = asyncio.run(run_blocking_in_loop())
+    assert log[0]["translated_message"] == "Hola"
+    assert logs[0][-1]["translated_message"] == "Hola"
+    assert provider.call_count == 2
+    assert provider.max_in_flight == 0
+    
+    # Independent prompts on a single provider
+    provider = AsyncMockProvider(response="Hola")
+    results = asyncio.run(provider.agenerate_many(["a", "b", "c", "d"], concurrency=3))
+    assert results == ["Hola"] * 4
+    assert provider.max_in_flight == 3
+    
+    print("  ✓ Async conversation tests passed")
+
+
+def test_streaming_conversation():
+    """Test writing turns to disk as the conversation runs."""
+    print("Testing streaming conversation...")
+    
+    import csv
+    import json
+    import statistics
+    import tempfile
+    
+    stats = RunningStats()
+    values = [0.5, 1.5, 2.0, 4.0]
+    for value in values:
+        stats.add(value)
+    assert stats.count == 4
+    assert abs(stats.mean - statistics.fmean(values)) < 1e-12
+    assert abs(stats.stdev - statistics.stdev(values)) < 1e-12
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        provider = MockLLMProvider(response="Hola")
+        interpreter = InterpreterAgent(provider, "Translate", "eng", "spa")
+        framework = EvaluationFramework(User("Alice", "eng"), User("Bob", "spa"), interpreter)
+        
+        jsonl_path = os.path.join(tmpdir, "turns.jsonl")
+        framework.run_conversation_streaming(["Hello", "Hi", "Bye"], jsonl_path)
+        with open(jsonl_path, encoding="utf-8") as f:
+            turns = [json.loads(line) for line in f]
+        assert [turn["turn"] for turn in turns] == [1, 2, 3]
+        assert turns[1]["from_user"] == "Bob"
+        assert turns[0]["translated_message"] == "Hola"
+        assert "timestamp" in turns[0]
+        
+        # Streamed turns are not kept in memory but still count towards metrics
+        assert framework.conversation_log == []
+        assert framework.evaluate_translation_quality()["total_turns"] == 3
+        
+        csv_path = os.path.join(tmpdir, "turns.csv")
+        framework.run_conversation_streaming(["Hello", "Hi"], csv_path, format="csv")
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 2
+        assert rows[1]["to_user"] == "Alice"
+        
+        # The distribution is left out while it would miss the streamed turns
+        framework.run_conversation(["Hello"])
+        metrics = framework.evaluate_translation_quality()
+        assert metrics["total_turns"] == 6
+        assert "p50_translation_time" not in metrics
+        framework.reset()
+        framework.run_conversation(["Hello"])
+        assert "p50_translation_time" in framework.evaluate_translation_quality()
+    
+    print("  ✓ Streaming conversation tests passed")
+
+
+def test_conversation_log_file():
+    """Test keeping the turns in a log file instead of memory."""
+    print("Testing conversation log file...")
+    
+    import json
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        def build_framework(log_path=None):
+            interpreter = InterpreterAgent(MockLLMProvider(response="Hola"), "Translate", "eng", "spa")
+            return EvaluationFramework(
+                User("Alice", "eng"), User("Bob", "spa"), interpreter,
+                name="logged", log_path=log_path
+            )
+        
+        in_memory = build_framework()
+        logged = build_framework(os.path.join(tmpdir, "log.jsonl"))
+        for fw in (in_memory, logged):
+            fw.run_conversation(["Hello", "Hi"])
+            turns = fw.run_conversation(["¿Qué tal?"], from_user=2)
+            fw.evaluate_translation_quality()
+            # A run returns only its own turns, and none in log mode
+            assert len(turns) == (0 if fw is logged else 1)
+        assert not logged._columns["turn"]
+        assert logged.to_columns()["turn"] == [1, 2, 1]
+        assert [t["turn"] for t in logged.conversation_log] == [1, 2, 1]
+        assert logged.conversation_log[2]["original_message"] == "¿Qué tal?"
+        assert logged.metrics.keys() == in_memory.metrics.keys()
+        
+        exported = []
+        for fw in (in_memory, logged):
+            path = os.path.join(tmpdir, f"{id(fw)}.json")
+            fw.export_results(path, format="json")
+            with open(path, encoding="utf-8") as f:
+                assert f.readline() == "{\n"
+                f.seek(0)
+                results = json.load(f)
+            del results["timestamp"], results["metrics"]
+            for turn in results["conversation"]:
+                del turn["timestamp"], turn["translation_time"]
+            exported.append(results)
+        assert exported[0] == exported[1]
+        
+        logged.reset()
+        path = os.path.join(tmpdir, "empty.json")
+        logged.run_conversation([])
+        logged.export_results(path, format="json")
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f)["conversation"] == []
+    
+    print("  ✓ Conversation log file tests passed")
+
+
+def test_metrics_only():
+    """Test runs that keep just the translation times."""
+    print("Testing metrics-only runs...")
+    
+    import tempfile
+    
+    interpreter = InterpreterAgent(MockLLMProvider(response="Hola"), "Translate", "eng", "spa")
+    framework = EvaluationFramework(
+        User("Alice", "eng"), User("Bob", "spa"), interpreter, record_detail="metrics_only"
+    )
+    assert framework.run_conversation(["Hello", "Hi", "Bye"]) == []
+    metrics = framework.evaluate_translation_quality()
+    assert metrics["total_turns"] == 3
+    assert "p95_translation_time" in metrics
+    assert framework.get_conversation_summary()["total_turns"] == 3
+    
+    # Only the recorded column is returned, and exports say the turns weren't kept
+    columns = framework.to_columns()
+    assert list(columns) == ["translation_time"]
+    assert len(columns["translation_time"]) == 3
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "results.json")
+        framework.export_results(path)
+        results = DataHandler.load_conversation_data(path)
+        assert "conversation" not in results
+        assert results["record_detail"] == "metrics_only"
+        assert results["metrics"]["total_turns"] == 3
+    
+    try:
+        EvaluationFramework(User("Alice", "eng"), User("Bob", "spa"), interpreter, record_detail="none")
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+    
+    print("  ✓ Metrics-only tests passed")
+
+
 def test_data_handler():
     """Test data handling utilities."""
     print("Testing data handler...")
@@ -152,6 +540,46 @@ def test_data_handler():
         assert loaded_data["session_name"] == "test"
         assert loaded_data["metrics"]["total_turns"] == 5
         
+        # Output is compact unless an indent is requested
+        with open(filepath, 'r', encoding='utf-8') as f:
+            assert "\n" not in f.read()
+        DataHandler.save_conversation_data(test_data, filepath, indent=2)
+        with open(filepath, 'r', encoding='utf-8') as f:
+            assert f.read().startswith('{\n  "session_name": "test"')
+        assert DataHandler.load_conversation_data(filepath) == test_data
+        
+        # Values orjson rejects fall back to json, and failed saves keep the file
+        DataHandler.save_conversation_data({"seed": 2 ** 70}, filepath)
+        assert DataHandler.load_conversation_data(filepath) == {"seed": 2 ** 70}
+        try:
+            DataHandler.save_conversation_data({"seed": object()}, filepath)
+            assert False, "Expected TypeError"
+        except TypeError:
+            pass
+        assert DataHandler.load_conversation_data(filepath) == {"seed": 2 ** 70}
+        
+        # Test aggregation, with and without the individual results
+        result_files = []
+        for turns, average in [(2, 1.0), (3, 2.0)]:
+            result_files.append(os.path.join(tmpdir, f"result{turns}.json"))
+            DataHandler.save_conversation_data(
+                {"metrics": {"total_turns": turns, "average_translation_time": average}},
+                result_files[-1]
+            )
+        aggregated = DataHandler.aggregate_results(result_files)
+        assert aggregated["num_evaluations"] == 2
+        assert aggregated["total_turns"] == 5
+        assert abs(aggregated["average_translation_time"] - 1.6) < 1e-12
+        assert [r["metrics"]["total_turns"] for r in aggregated["evaluations"]] == [2, 3]
+        totals = DataHandler.aggregate_results(result_files, return_individual=False)
+        assert "evaluations" not in totals
+        assert totals == {key: aggregated[key] for key in totals}
+        many_files = result_files * 50
+        aggregated = DataHandler.aggregate_results(many_files)
+        assert aggregated["total_turns"] == 250
+        assert [r["metrics"]["total_turns"] for r in aggregated["evaluations"]] == [2, 3] * 50
+        assert DataHandler.aggregate_results(many_files, return_individual=False)["total_turns"] == 250
+        
         # Test CSV export
         conversation_log = [
             {"turn": 1, "from_user": "Alice", "message": "Hello"},
@@ -161,6 +589,35 @@ def test_data_handler():
         csv_path = os.path.join(tmpdir, "test.csv")
         DataHandler.export_to_csv(conversation_log, csv_path)
         assert os.path.exists(csv_path)
+        
+        # Output directories are created again after a chdir or a removal
+        import shutil
+        cwd = os.getcwd()
+        try:
+            for workdir in ("a", "b"):
+                os.makedirs(os.path.join(tmpdir, workdir))
+                os.chdir(os.path.join(tmpdir, workdir))
+                DataHandler.save_conversation_data(test_data, os.path.join("results", "r.json"))
+                assert os.path.exists(os.path.join(tmpdir, workdir, "results", "r.json"))
+        finally:
+            os.chdir(cwd)
+        nested_path = os.path.join(tmpdir, "nested", "r.json")
+        DataHandler.save_conversation_data(test_data, nested_path)
+        shutil.rmtree(os.path.join(tmpdir, "nested"))
+        DataHandler.save_conversation_data(test_data, nested_path)
+        assert DataHandler.load_conversation_data(nested_path) == test_data
+        
+        # Brief loads are cached but pick up changes to the file
+        brief_path = os.path.join(tmpdir, "brief.txt")
+        with open(brief_path, "w", encoding="utf-8") as f:
+            f.write("Translate formally")
+        assert DataHandler.load_translation_brief(brief_path) == "Translate formally"
+        assert DataHandler.load_translation_brief(brief_path) == "Translate formally"
+        with open(brief_path, "w", encoding="utf-8") as f:
+            f.write("Translate casually")
+        stat = os.stat(brief_path)
+        os.utime(brief_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert DataHandler.load_translation_brief(brief_path) == "Translate casually"
     
     print("  ✓ Data handler tests passed")
 
@@ -182,9 +639,139 @@ def test_mock_provider():
     name = provider.get_provider_name()
     assert name == "Mock Provider"
     
+    # Call metrics go to the provider's callback, if it has one
+    report_call(provider, 0.0)
+    calls = []
+    provider.metrics_callback = lambda *metrics: calls.append(metrics)
+    provider.model_name = "mock-model"
+    usage = type("Usage", (), {"prompt_tokens": 12, "completion_tokens": 3})()
+    report_call(provider, 0.0, type("Response", (), {"usage": usage})())
+    error = RuntimeError("boom")
+    report_call(provider, 0.0, error=error)
+    assert [call[:4] for call in calls] == [
+        ("Mock Provider", "mock-model", 12, 3),
+        ("Mock Provider", "mock-model", None, None)
+    ]
+    assert calls[0][4] > 0 and calls[0][5] is None
+    assert calls[1][5] is error
+    
     print("  ✓ Mock provider tests passed")
 
 
+def test_providers():
+    """Test the provider implementations with stubbed SDK clients."""
+    print("Testing providers...")
+    
+    from types import SimpleNamespace
+    from interpreter_agent_eval.providers import _openai_compat
+    from interpreter_agent_eval.providers import GoogleAIProvider, OpenRouterProvider, VLLMProvider
+    
+    requests = []
+    
+    class StubClient:
+        def __init__(self, api_key, base_url=None, max_retries=None):
+            self.api_key = api_key
+            self.base_url = base_url
+            self.max_retries = max_retries
+            self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+        
+        def create(self, **params):
+            requests.append((self, params))
+            if params["messages"][0]["content"] == "fail":
+                raise ConnectionError("unreachable")
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content="Hola"))],
+                usage=SimpleNamespace(prompt_tokens=5, completion_tokens=1)
+            )
+    
+    get_openai_client = _openai_compat.get_openai_client
+    _openai_compat.get_openai_client = StubClient
+    try:
+        # Requests rotate over the keys, and retries reach every client
+        calls = []
+        provider = OpenRouterProvider(
+            ["key1", "key2"], "some/model", app_name="eval", max_retries=2,
+            metrics_callback=lambda *metrics: calls.append(metrics)
+        )
+        assert [provider.generate("Hello") for _ in range(3)] == ["Hola"] * 3
+        assert [client.api_key for client, _ in requests] == ["key1", "key2", "key1"]
+        assert {client.max_retries for client, _ in requests} == {2}
+        assert requests[0][1]["extra_headers"] == {"X-Title": "eval"}
+        assert [call[2:4] for call in calls] == [(5, 1)] * 3
+        
+        try:
+            provider.generate("fail")
+            assert False, "Expected RuntimeError"
+        except RuntimeError as e:
+            assert str(e).startswith("OpenRouter generation failed")
+        assert isinstance(calls[-1][5], ConnectionError)
+        
+        requests.clear()
+        provider = VLLMProvider(["http://a:8000/", "http://b:8000"], "some-model")
+        for _ in range(3):
+            provider.generate("Hello", temperature=0.5)
+        assert [client.base_url for client, _ in requests] == [
+            "http://a:8000/v1", "http://b:8000/v1", "http://a:8000/v1"
+        ]
+        assert requests[0][1]["temperature"] == 0.5
+        assert requests[0][0].api_key == "EMPTY"
+        
+        for build in (lambda: OpenRouterProvider([], "some/model"), lambda: VLLMProvider([], "some-model")):
+            try:
+                build()
+                assert False, "Expected ValueError"
+            except ValueError:
+                pass
+    finally:
+        _openai_compat.get_openai_client = get_openai_client
+    
+    # Providers get new clients after the shared ones are closed
+    from interpreter_agent_eval.providers import _client_cache, close_shared_clients
+    
+    class ClosableStubClient(StubClient):
+        closed = False
+        
+        def close(self):
+            self.closed = True
+    
+    requests.clear()
+    provider = VLLMProvider("http://c:8000", "some-model")
+    first = _client_cache._clients[("http://c:8000/v1", "EMPTY", None)] = ClosableStubClient("EMPTY")
+    provider.generate("Hello")
+    close_shared_clients()
+    assert first.closed
+    second = _client_cache._clients[("http://c:8000/v1", "EMPTY", None)] = ClosableStubClient("EMPTY")
+    provider.generate("Hello")
+    assert [client for client, _ in requests] == [first, second]
+    close_shared_clients()
+    
+    # Async clients are closed, and their loops released, when asyncio.run ends
+    
+    class AsyncStubClient:
+        closed = False
+        
+        async def close(self):
+            self.closed = True
+    
+    async def get_client():
+        return _client_cache.get_async_client(("stub",), AsyncStubClient)
+    
+    client = asyncio.run(get_client())
+    assert client.closed
+    assert not _client_cache._async_clients
+    
+    # Google AI generation configs are reused for the same call parameters
+    provider = GoogleAIProvider(api_key="key", temperature=0.2)
+    provider._create_config = lambda max_tokens, temperature, kwargs: object()
+    config = provider._build_config(100, None, {})
+    assert provider._build_config(100, None, {}) is config
+    assert provider._build_config(200, None, {}) is not config
+    unhashable = {"stop_sequences": ["\n"]}
+    assert provider._build_config(100, None, unhashable) is not provider._build_config(100, None, unhashable)
+    
+    print("  ✓ Provider tests passed")
+
+
 def run_all_tests():
     """Run all test functions."""
     print("\n" + "=" * 80)
@@ -195,9 +782,16 @@ def run_all_tests():
         test_user_creation,
         test_user_send_message,
         test_interpreter_translation,
+        test_translation_cache,
         test_evaluation_framework,
+        test_batch_translation,
+        test_run_conversation_async,
+        test_streaming_conversation,
+        test_conversation_log_file,
+        test_metrics_only,
         test_data_handler,
-        test_mock_provider
+        test_mock_provider,
+        test_providers
     ]
     
     passed = 0